@@ -13,7 +13,7 @@ from dotenv import load_dotenv
 from datetime import datetime
 
 from libs.productivity_tracker import ProductivityTracker
-from libs.data_utils import save_data, save_ratio_summary
+from libs.data_utils import save_data, save_ratio_summary, write_json
 from libs.reports import display_productivity_report, display_personal_report, display_comparison_report, generate_text_summary
 from libs.visualizations import create_heatmap, create_timeline_chart
 
@@ -34,11 +34,17 @@ def main():
     parser.add_argument('--heatmap', action='store_true', help='Generate heatmap visualization')
     parser.add_argument('--timeline', action='store_true', help='Generate timeline chart')
     parser.add_argument('--viz-output', help='Output path for visualization files (optional)')
+    parser.add_argument('--high-quality', action='store_true', help='Save visualizations at 300 DPI instead of 150')
+    parser.add_argument('--fast-heatmap', action='store_true', help='Save commit-only heatmaps as a bare PNG grid (no labels or pie chart)')
     parser.add_argument('--include-prs', action='store_true', help='Include pull request metrics')
     parser.add_argument('--include-reviews', action='store_true', help='Include code review metrics')
     parser.add_argument('--include-issues', action='store_true', help='Include issue creation metrics')
     parser.add_argument('--include-lines', action='store_true', help='Include lines of code modified metrics')
     parser.add_argument('--all', action='store_true', help='Include all available productivity indicators')
+    parser.add_argument('--include-auto-commits', action='store_true', help='Count lines from automated commits (merges, dependency bumps) in line metrics')
+    parser.add_argument('--include-files', action='store_true', help='Keep per-file change details for each commit in the JSON output (requires --include-lines)')
+    parser.add_argument('--keep-commit-details', action='store_true', help='Keep the full GitHub commit payload in the JSON output instead of date, message and stats only')
+    parser.add_argument('--max-commits-per-repo', type=int, default=1000, help='Stop collecting commits in a repository after this many, at least 1 (default: 1000)')
     parser.add_argument('-v', '--verbose', action='store_true', help='Show detailed progress and branch-by-branch information')
     parser.add_argument('--repoignore', default='.repoignore', help='Path to repository ignore file (default: .repoignore)')
     parser.add_argument('--personal', action='store_true', help='Track personal repositories instead of organization repositories')
@@ -46,6 +52,9 @@ def main():
     
     args = parser.parse_args()
     
+    if args.max_commits_per_repo < 1:
+        parser.error("--max-commits-per-repo must be at least 1")
+    
     # Get values from .env file or command line arguments
     username = args.username or os.getenv('GITHUB_USERNAME')
     organization = args.organization or os.getenv('GITHUB_ORGANIZATION')
@@ -80,7 +89,8 @@ def main():
             sys.exit(1)
     
     # Initialize tracker
-    tracker = ProductivityTracker(organization or username, token, args.verbose)
+    tracker = ProductivityTracker(organization or username, token, args.verbose, args.include_auto_commits,
+                                  args.include_files, args.keep_commit_details)
     
     # Handle different tracking modes
     if args.compare:
@@ -94,7 +104,8 @@ def main():
             args.include_reviews,
             args.include_issues,
             args.include_lines,
-            args.repoignore
+            args.repoignore,
+            args.max_commits_per_repo
         )
         
         # Save individual org and personal data files for future comparisons
@@ -112,9 +123,7 @@ def main():
             timestamp = datetime.now().strftime("%Y-%m-%d")
             personal_path = os.path.join(output_dir, f"personal_data_{username}_{timestamp}.json")
             
-            import json
-            with open(personal_path, 'w') as f:
-                json.dump(personal_data, f, indent=2)
+            write_json(personal_data, personal_path)
             print(f"Personal data saved to {personal_path}")
         
         # Display comparison report
@@ -131,7 +140,8 @@ def main():
             args.include_reviews,
             args.include_issues,
             args.include_lines,
-            args.repoignore
+            args.repoignore,
+            args.max_commits_per_repo
         )
         
         # Display personal report
@@ -149,7 +159,8 @@ def main():
             args.include_reviews,
             args.include_issues,
             args.include_lines,
-            args.repoignore
+            args.repoignore,
+            args.max_commits_per_repo
         )
         
         # Display report
@@ -174,7 +185,7 @@ def main():
     if args.heatmap:
         print("\\nGenerating heatmap visualization...")
         viz_path = args.viz_output if args.viz_output else None
-        create_heatmap(data, viz_path)
+        create_heatmap(data, viz_path, args.high_quality, args.fast_heatmap)
         
         # Generate text summary
         if not args.compare:  # Only for non-comparison data
@@ -185,7 +196,7 @@ def main():
     if args.timeline:
         print("\\nGenerating timeline chart...")
         viz_path = args.viz_output if args.viz_output else None
-        create_timeline_chart(data, viz_path)
+        create_timeline_chart(data, viz_path, args.high_quality)
 
 
 if __name__ == "__main__":
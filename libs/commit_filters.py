@@ -0,0 +1,25 @@
+"""
+Heuristics for recognising automated or trivial commits.
+"""
+
+import re
+from typing import Dict, List, Tuple
+
+_AUTO = re.compile(r'^(Merge pull request|Merge branch|Bump |chore\(deps\)|dependabot|renovate|Update .*\.lock|Auto-generated)', re.I)
+
+
+def is_auto_commit(commit: Dict) -> bool:
+    """Check if a commit message looks generated (merges, dependency bumps, lockfile updates)."""
+    return bool(_AUTO.match(commit['commit']['message']))
+
+
+def partition_auto_commits(commits: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    """Split commits into (interesting, automated) lists, preserving order."""
+    interesting = []
+    automated = []
+    for commit in commits:
+        if is_auto_commit(commit):
+            automated.append(commit)
+        else:
+            interesting.append(commit)
+    return interesting, automated
@@ -10,6 +10,28 @@ from pathlib import Path
 from collections import defaultdict
 import fnmatch
 
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the stdlib
+    orjson = None
+
+
+def loads_json(raw: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json(data, path: str):
+    """Write data to path as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
 
 def get_timeframe_dates(timeframe: str, custom_start: str = None, custom_end: str = None) -> tuple:
     """Get start and end dates based on timeframe preset or custom dates."""
@@ -78,9 +100,11 @@ def should_ignore_repo(repo_name: str, ignore_patterns: List[str], verbose: bool
     return False
 
 
-def filter_repositories(repos: List[Dict], repoignore_path: str = '.repoignore', verbose: bool = False) -> List[Dict]:
-    """Filter repositories based on .repoignore patterns."""
-    ignore_patterns = load_repoignore(repoignore_path, verbose)
+def filter_repositories(repos: List[Dict], repoignore_path: str = '.repoignore', verbose: bool = False,
+                        ignore_patterns: Optional[List[str]] = None) -> List[Dict]:
+    """Filter repositories based on .repoignore patterns (pass ignore_patterns to skip re-reading the file)."""
+    if ignore_patterns is None:
+        ignore_patterns = load_repoignore(repoignore_path, verbose)
     
     if not ignore_patterns:
         return repos
@@ -164,6 +188,23 @@ def extract_metrics(user_data: Dict) -> Dict:
     return metrics
 
 
+def extract_commit_dates(repositories: Dict):
+    """Author day of every commit in a repositories mapping, as a numpy datetime64[D] array."""
+    import numpy as np
+    # The 'YYYY-MM-DD' prefix is all that is needed, and numpy parses it in C
+    return np.fromiter((commit['commit']['author']['date'][:10]
+                        for repo_data in repositories.values() for commit in repo_data.get('commits', ())),
+                       dtype='U10').astype('datetime64[D]')
+
+
+def extract_commit_line_changes(repositories: Dict):
+    """Lines changed per commit, parallel to extract_commit_dates (-1 where a commit has no stats)."""
+    import numpy as np
+    return np.fromiter((commit['stats'].get('total', 0) if commit.get('stats') else -1
+                        for repo_data in repositories.values() for commit in repo_data.get('commits', ())),
+                       dtype=np.int64)
+
+
 def create_output_directory(username: str) -> str:
     """Create and return the output directory for a user."""
     output_dir = f"outputs/{username}"
@@ -188,8 +229,7 @@ def save_data(data: Dict, output_path: Optional[str] = None, is_comparison: bool
         else:
             final_path = os.path.join(output_dir, f"raw_data_{username}_{timestamp}.json")
     
-    with open(final_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json(data, final_path)
     
     return final_path
 
@@ -220,8 +260,7 @@ def save_ratio_summary(data: Dict) -> Optional[str]:
     }
     
     ratio_path = os.path.join(output_dir, f"ratio_summary_{username}_{timestamp}.json")
-    with open(ratio_path, 'w') as f:
-        json.dump(ratio_data, f, indent=2)
+    write_json(ratio_data, ratio_path)
     
     return ratio_path
 
@@ -4,14 +4,35 @@ GitHub API client with rate limiting and retry logic.
 
 import requests
 import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
 import threading
 from typing import Dict, List, Optional
+from urllib.parse import quote
+
+from .data_utils import loads_json
+from .rate_limiter import RateLimiter
+
+
+def _is_commit_author(commit: Dict, username: str) -> bool:
+    """Match a commit to a user by GitHub login, or by author email when no account is linked.
+
+    The email check accepts the user's noreply address, or the username itself when it is an email.
+    """
+    username = username.lower()
+    author = commit.get('author') or {}
+    if author.get('login', '').lower() == username:
+        return True
+    email = (commit['commit']['author'].get('email') or '').lower()
+    return email == username or (email.endswith('@users.noreply.github.com')
+                                 and email.split('@')[0].split('+')[-1] == username)
 
 
 class GitHubAPIClient:
     """GitHub API client with built-in rate limiting and retry logic."""
     
-    def __init__(self, github_token: Optional[str] = None, verbose: bool = False):
+    def __init__(self, github_token: Optional[str] = None, verbose: bool = False,
+                 rate_limiter: Optional[RateLimiter] = None, search_rate_limiter: Optional[RateLimiter] = None):
         self.github_token = github_token
         self.base_url = "https://api.github.com"
         self.verbose = verbose
@@ -25,11 +46,9 @@ class GitHubAPIClient:
             'Accept': 'application/vnd.github.v3+json'
         }
         
-        # Rate limiting tracking
-        self.rate_limit_remaining = 5000
-        self.rate_limit_reset = 0
-        self.search_rate_limit_remaining = 30
-        self.search_rate_limit_reset = 0
+        # Rate limiting shared by every thread using this client
+        self.rate_limiter = rate_limiter or RateLimiter(remaining=5000)
+        self.search_rate_limiter = search_rate_limiter or RateLimiter(remaining=30)
     
     def _verbose_print(self, message: str):
         """Thread-safe verbose printing."""
@@ -37,41 +56,66 @@ class GitHubAPIClient:
             with self._lock:
                 print(f"[VERBOSE] {message}")
     
-    def make_request(self, url: str, params: Optional[Dict] = None, is_search: bool = False, max_retries: int = 3) -> requests.Response:
+    @staticmethod
+    def _parse_retry_after(value: str) -> Optional[float]:
+        """Parse a Retry-After header given as delay seconds or an HTTP-date; None if it is neither."""
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            # Dates sent with a -0000 offset come back naive, but are still UTC
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(retry_at.timestamp() - time.time(), 0.0)
+    
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Return the server-requested wait for a rate-limited response, or None if not rate limited."""
+        if response.status_code not in (403, 429):
+            return None
+        
+        if 'Retry-After' in response.headers:
+            retry_after = self._parse_retry_after(response.headers['Retry-After'])
+            if retry_after is not None:
+                return retry_after
+        
+        # Primary limit exhausted: wait for the window to reset
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            reset = float(response.headers.get('X-RateLimit-Reset', time.time() + 60))
+            return max(reset - time.time(), 0) + 1
+        
+        # Secondary limits come back as 429, or as 403 with an explanatory message
+        if response.status_code == 429 or 'rate limit' in response.text.lower():
+            return 0.0
+        
+        return None
+    
+    def make_request(self, url: str, params: Optional[Dict] = None, is_search: bool = False, max_retries: int = 5) -> requests.Response:
         """Make API request with rate limiting and retry logic."""
+        limiter = self.search_rate_limiter if is_search else self.rate_limiter
+        
         for attempt in range(max_retries):
             try:
-                # Check rate limits before making request
-                if is_search:
-                    if self.search_rate_limit_remaining <= 1:
-                        if self.search_rate_limit_reset > time.time():
-                            wait_time = self.search_rate_limit_reset - time.time() + 1
-                            self._verbose_print(f"Search API rate limit reached. Waiting {wait_time:.0f} seconds...")
-                            time.sleep(wait_time)
-                else:
-                    if self.rate_limit_remaining <= 1:
-                        if self.rate_limit_reset > time.time():
-                            wait_time = self.rate_limit_reset - time.time() + 1
-                            self._verbose_print(f"API rate limit reached. Waiting {wait_time:.0f} seconds...")
-                            time.sleep(wait_time)
+                # Wait for the shared budget before making request
+                waited = limiter.acquire()
+                if waited >= 1:
+                    self._verbose_print(f"{'Search API' if is_search else 'API'} rate limiter paused for {waited:.0f} seconds")
                 
                 response = requests.get(url, headers=self.headers, params=params)
                 
                 # Update rate limit tracking from response headers
-                if 'X-RateLimit-Remaining' in response.headers:
-                    if is_search:
-                        self.search_rate_limit_remaining = int(response.headers.get('X-RateLimit-Remaining', 30))
-                        self.search_rate_limit_reset = int(response.headers.get('X-RateLimit-Reset', time.time() + 60))
-                    else:
-                        self.rate_limit_remaining = int(response.headers.get('X-RateLimit-Remaining', 5000))
-                        self.rate_limit_reset = int(response.headers.get('X-RateLimit-Reset', time.time() + 3600))
+                limiter.update(response.headers)
                 
-                # Handle rate limit exceeded (429)
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get('Retry-After', 60))
+                # Handle rate limit exceeded (429 or 403 secondary limit)
+                retry_after = self._retry_after(response)
+                if retry_after is not None:
                     if attempt < max_retries - 1:
-                        self._verbose_print(f"Rate limit exceeded (429). Retrying after {retry_after} seconds... (attempt {attempt + 1}/{max_retries})")
-                        time.sleep(retry_after)
+                        # Exponential backoff unless the server told us how long to wait
+                        wait_time = limiter.backoff(attempt, retry_after or None)
+                        self._verbose_print(f"Rate limit exceeded ({response.status_code}). Retrying after {wait_time:.0f} seconds... (attempt {attempt + 1}/{max_retries})")
                         continue
                     else:
                         print(f"Rate limit exceeded and max retries reached. Response: {response.status_code}")
@@ -121,7 +165,7 @@ class GitHubAPIClient:
                     print("Access forbidden. Token may lack organization access.")
                 break
             
-            page_repos = response.json()
+            page_repos = loads_json(response.content)
             if not page_repos:
                 break
             
@@ -152,7 +196,7 @@ class GitHubAPIClient:
                     print(f"User {username} not found or has no public repositories.")
                 break
 
-            page_repos = response.json()
+            page_repos = loads_json(response.content)
             if not page_repos:
                 break
 
@@ -162,9 +206,20 @@ class GitHubAPIClient:
 
         return repos
     
-    def get_repo_branches(self, org_name: str, repo_name: str) -> List[str]:
-        """Get all branches for a repository."""
-        branches = []
+    def get_repo_default_branch(self, org_name: str, repo_name: str) -> Optional[str]:
+        """Get the default branch name for a repository."""
+        url = f"{self.base_url}/repos/{org_name}/{repo_name}"
+        response = self.make_request(url)
+        
+        if response.status_code != 200:
+            self._verbose_print(f"Error fetching repository info for {repo_name}: {response.status_code}")
+            return None
+        
+        return loads_json(response.content).get('default_branch')
+    
+    def get_repo_branch_heads(self, org_name: str, repo_name: str) -> Dict[str, str]:
+        """Get all branches for a repository mapped to their head commit SHA."""
+        heads = {}
         page = 1
         
         while True:
@@ -177,16 +232,18 @@ class GitHubAPIClient:
                 self._verbose_print(f"Error fetching branches for {repo_name}: {response.status_code}")
                 break
             
-            page_branches = response.json()
+            page_branches = loads_json(response.content)
             if not page_branches:
                 break
             
-            branches.extend([branch['name'] for branch in page_branches])
+            for branch in page_branches:
+                heads[branch['name']] = branch['commit']['sha']
             page += 1
         
-        return branches
+        return heads
     
-    def get_branch_commits(self, org_name: str, repo_name: str, branch: str, username: str, since: str, until: str) -> List[Dict]:
+    def get_branch_commits(self, org_name: str, repo_name: str, branch: str, username: str, since: str, until: str,
+                           max_commits: Optional[int] = None) -> List[Dict]:
         """Get commits for a specific branch."""
         commits = []
         page = 1
@@ -213,7 +270,7 @@ class GitHubAPIClient:
                     self._verbose_print(f"Branch {branch} in {repo_name}: Error {response.status_code}")
                 break
             
-            page_commits = response.json()
+            page_commits = loads_json(response.content)
             if not page_commits:
                 break
             
@@ -222,27 +279,70 @@ class GitHubAPIClient:
                 commit['branch'] = branch
             
             commits.extend(page_commits)
+            
+            # A short page is the last one; commits are returned newest first,
+            # so once the tail falls before the window there is nothing left to fetch
+            if len(page_commits) < 100 or page_commits[-1]['commit']['committer']['date'] < since:
+                break
+            if max_commits is not None and len(commits) >= max_commits:
+                self._verbose_print(f"Branch {branch} in {repo_name}: Reached limit of {max_commits} commits")
+                break
+            page += 1
+        
+        self._verbose_print(f"Branch {branch} in {repo_name}: Found {len(commits)} commits in {page} page(s)")
+        return commits
+    
+    def get_branch_diverged_commits(self, org_name: str, repo_name: str, base: str, branch: str,
+                                    username: str, since: str, until: str) -> List[Dict]:
+        """Get the user's commits on a branch that are not reachable from the base branch."""
+        commits = []
+        page = 1
+        
+        self._verbose_print(f"Comparing branch {branch} against {base} in {repo_name}")
+        
+        while True:
+            url = f"{self.base_url}/repos/{org_name}/{repo_name}/compare/{quote(base, safe='/')}...{quote(branch, safe='/')}"
+            params = {'page': page, 'per_page': 100}
+            
+            response = self.make_request(url, params)
+            
+            if response.status_code != 200:
+                self._verbose_print(f"Branch {branch} in {repo_name}: Compare error {response.status_code}")
+                break
+            
+            data = loads_json(response.content)
+            page_commits = data.get('commits', [])
+            
+            # Compare does not filter server-side, so apply author and timeframe here
+            for commit in page_commits:
+                commit_date = commit['commit']['author']['date']
+                if _is_commit_author(commit, username) and since <= commit_date <= until:
+                    commit['branch'] = branch
+                    commits.append(commit)
+            
+            if len(page_commits) < 100 or page * 100 >= data.get('ahead_by', 0):
+                break
             page += 1
         
-        self._verbose_print(f"Branch {branch} in {repo_name}: Found {len(commits)} commits")
+        self._verbose_print(f"Branch {branch} in {repo_name}: Found {len(commits)} diverged commits")
         return commits
     
-    def get_commit_stats(self, org_name: str, repo_name: str, commit_sha: str) -> Dict:
-        """Get statistics for a single commit."""
+    def get_commit_stats(self, org_name: str, repo_name: str, commit_sha: str, include_files: bool = False) -> Dict:
+        """Get statistics for a single commit (per-file details only when include_files is set)."""
         url = f"{self.base_url}/repos/{org_name}/{repo_name}/commits/{commit_sha}"
         response = self.make_request(url)
         
         if response.status_code == 200:
-            detailed = response.json()
-            return {
-                'stats': detailed.get('stats', {}),
-                'files': detailed.get('files', [])
-            }
+            detailed = loads_json(response.content)
+            result = {'stats': detailed.get('stats', {})}
+            if include_files:
+                result['files'] = detailed.get('files', [])
+            return result
         else:
-            return {
-                'stats': {'total': 0, 'additions': 0, 'deletions': 0},
-                'files': []
-            }
+            result = {'stats': {'total': 0, 'additions': 0, 'deletions': 0}}
+            if include_files:
+                result['files'] = []
+            return result
     
     def search_pull_requests(self, username: str, org_name: str, since: str, until: str) -> List[Dict]:
         """Get pull requests created by the user in the organization."""
@@ -264,7 +364,7 @@ class GitHubAPIClient:
                 print(f"Error fetching pull requests: {response.status_code}")
                 break
             
-            data = response.json()
+            data = loads_json(response.content)
             if not data.get('items'):
                 break
             
@@ -296,7 +396,7 @@ class GitHubAPIClient:
                 print(f"Error fetching code reviews: {response.status_code}")
                 break
             
-            data = response.json()
+            data = loads_json(response.content)
             if not data.get('items'):
                 break
             
@@ -328,7 +428,7 @@ class GitHubAPIClient:
                 print(f"Error fetching issues: {response.status_code}")
                 break
             
-            data = response.json()
+            data = loads_json(response.content)
             if not data.get('items'):
                 break
             
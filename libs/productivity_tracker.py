@@ -3,30 +3,90 @@ Core productivity tracking functionality.
 """
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
 from collections import defaultdict
 from tqdm import tqdm
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from datetime import datetime
 
 from .github_api import GitHubAPIClient
-from .data_utils import get_timeframe_dates, filter_repositories
+from .commit_filters import partition_auto_commits
+from .progress import Progress
+from .data_utils import get_timeframe_dates, filter_repositories, load_repoignore
+
+
+_EMPTY = {}
+
+
+def _sum_line_stats(commits: List[Dict]) -> tuple:
+    """Sum additions, deletions and total changes over commits in a single pass."""
+    additions = deletions = changes = 0
+    for commit in commits:
+        stats = commit.get('stats') or _EMPTY
+        additions += stats.get('additions', 0)
+        deletions += stats.get('deletions', 0)
+        changes += stats.get('total', 0)
+    return additions, deletions, changes
+
+
+def _slim_commit(commit: Dict) -> Dict:
+    """Keep only the commit fields used by reports, visualizations and comparisons."""
+    details = commit['commit']
+    slim = {
+        'sha': commit['sha'],
+        'commit': {
+            'message': details['message'],
+            'author': {'date': details['author']['date']}
+        }
+    }
+    if 'branch' in commit:
+        slim['branch'] = commit['branch']
+    return slim
+
+
+def _sha_key(commit: Dict) -> int:
+    """Dedup key for a commit: the first 64 bits of its SHA as an int (collisions negligible at this scale)."""
+    return int(commit['sha'][:16], 16)
 
 
 class ProductivityTracker:
     """Core productivity tracking logic."""
     
-    def __init__(self, org_name: str, github_token: Optional[str] = None, verbose: bool = False):
+    def __init__(self, org_name: str, github_token: Optional[str] = None, verbose: bool = False,
+                 include_auto_commits: bool = False, include_files: bool = False,
+                 keep_commit_details: bool = False):
         self.org_name = org_name
         self.verbose = verbose
+        self.include_auto_commits = include_auto_commits
+        self.include_files = include_files
+        self.keep_commit_details = keep_commit_details
         self.api_client = GitHubAPIClient(github_token, verbose)
+        
+        # .repoignore patterns are parsed once per path and reused by both org and personal runs
+        self._repoignore_cache: Dict[str, List[str]] = {}
+        self._print_lock = threading.Lock()
+    
+    def _print(self, message: str):
+        """Thread-safe printing for messages emitted from repository workers."""
+        with self._print_lock:
+            print(message)
     
-    def get_commit_stats_batch(self, repo_name: str, commits: List[Dict]) -> List[Dict]:
+    def _filter_repos(self, repos: List[Dict], repoignore_path: str) -> List[Dict]:
+        """Filter repositories with .repoignore patterns parsed once per path."""
+        if repoignore_path not in self._repoignore_cache:
+            self._repoignore_cache[repoignore_path] = load_repoignore(repoignore_path, self.verbose)
+        return filter_repositories(repos, repoignore_path, self.verbose, self._repoignore_cache[repoignore_path])
+    
+    def get_commit_stats_batch(self, repo_name: str, commits: List[Dict], owner: Optional[str] = None) -> List[Dict]:
         """Fetch commit statistics in parallel for better performance."""
+        owner = owner or self.org_name
+        
         def get_single_commit_stats(commit):
             sha = commit['sha']
-            stats_data = self.api_client.get_commit_stats(self.org_name, repo_name, sha)
+            stats_data = self.api_client.get_commit_stats(owner, repo_name, sha, self.include_files)
             commit['stats'] = stats_data['stats']
-            commit['files'] = stats_data['files']
+            if self.include_files:
+                commit['files'] = stats_data['files']
             return commit
         
         if not commits:
@@ -36,79 +96,199 @@ class ProductivityTracker:
         
         # Use ThreadPoolExecutor for parallel stats fetching
         with ThreadPoolExecutor(max_workers=5) as executor:
-            if self.verbose:
-                # Show progress bar in verbose mode
-                futures = {executor.submit(get_single_commit_stats, commit): commit for commit in commits}
-                results = []
-                for future in tqdm(as_completed(futures), total=len(commits), desc=f"Stats for {repo_name}"):
+            futures = [executor.submit(get_single_commit_stats, commit) for commit in commits]
+            results = []
+            # Show progress counter in verbose mode
+            with Progress(len(commits), f"Stats for {repo_name}", enabled=self.verbose) as progress:
+                for future in as_completed(futures):
                     results.append(future.result())
-            else:
-                futures = [executor.submit(get_single_commit_stats, commit) for commit in commits]
-                results = [future.result() for future in as_completed(futures)]
+                    progress.tick()
         
         return results
     
-    def get_user_commits_in_repo(self, repo_name: str, username: str, since: str, until: str, include_stats: bool = False) -> List[Dict]:
+    def get_user_commits_in_repo(self, repo_name: str, username: str, since: str, until: str, include_stats: bool = False,
+                                 default_branch: Optional[str] = None, max_commits: int = 1000,
+                                 owner: Optional[str] = None) -> List[Dict]:
         """Get commits by a specific user in a repository within the timeframe from ALL branches."""
-        # Get all branches
-        branches = self.api_client.get_repo_branches(self.org_name, repo_name)
-        if not branches:
+        owner = owner or self.org_name
+        
+        # Get all branches with their head commits
+        branch_heads = self.api_client.get_repo_branch_heads(owner, repo_name)
+        if not branch_heads:
             if self.verbose:
-                print(f"  No branches found for {repo_name}")
+                self._print(f"  No branches found for {repo_name}")
             return []
         
+        if not default_branch:
+            default_branch = self.api_client.get_repo_default_branch(owner, repo_name)
+        if default_branch not in branch_heads:
+            default_branch = next(iter(branch_heads))
+        
+        # Only branches whose head differs from the default branch can hold extra commits
+        default_head = branch_heads[default_branch]
+        seen_heads = {default_head}
+        diverged_branches = []
+        for branch, head_sha in branch_heads.items():
+            if head_sha not in seen_heads:
+                seen_heads.add(head_sha)
+                diverged_branches.append(branch)
+        
+        branches = list(branch_heads)
         if self.verbose:
-            print(f"  Checking {len(branches)} branches: {', '.join(branches[:5])}{'...' if len(branches) > 5 else ''}")
+            self._print(f"  Checking {len(branches)} branches in {repo_name}: {', '.join(branches[:5])}{'...' if len(branches) > 5 else ''}")
         else:
-            print(f"  Checking {len(branches)} branches")
+            self._print(f"  Checking {len(branches)} branches in {repo_name}")
+        self.api_client._verbose_print(f"{repo_name}: {len(diverged_branches)} branches diverge from {default_branch}")
         
-        # Use ThreadPoolExecutor for parallel branch processing
         all_commits = []
-        seen_shas = set()
+        seen_shas: Set[int] = set()
         
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            # Submit tasks for each branch
-            future_to_branch = {
-                executor.submit(self.api_client.get_branch_commits, self.org_name, repo_name, branch, username, since, until): branch 
-                for branch in branches
-            }
+        # Seed with the default branch history
+        for commit in self.api_client.get_branch_commits(owner, repo_name, default_branch, username, since, until,
+                                                         max_commits=max_commits):
+            key = _sha_key(commit)
+            if key not in seen_shas:
+                seen_shas.add(key)
+                all_commits.append(commit)
+        
+        if len(all_commits) >= max_commits:
+            diverged_branches = []
+        
+        seen_lock = threading.Lock()
+        
+        def fetch_and_dedup(branch):
+            # Deduplicate inside the worker so the main thread only concatenates
+            branch_commits = self.api_client.get_branch_diverged_commits(owner, repo_name, default_branch,
+                                                                         branch, username, since, until)
+            new_commits = []
+            with seen_lock:
+                for commit in branch_commits:
+                    key = _sha_key(commit)
+                    if key not in seen_shas:
+                        seen_shas.add(key)
+                        new_commits.append(commit)
+            return new_commits
+        
+        # Use ThreadPoolExecutor for parallel processing of diverged branches
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # Submit tasks for each diverged branch
+            future_to_branch = {executor.submit(fetch_and_dedup, branch): branch for branch in diverged_branches}
             
             # Collect results with progress tracking
-            if self.verbose:
-                for future in tqdm(as_completed(future_to_branch), total=len(branches), desc=f"Branches in {repo_name}"):
-                    branch_commits = future.result()
-                    # Deduplicate commits
-                    for commit in branch_commits:
-                        if commit['sha'] not in seen_shas:
-                            seen_shas.add(commit['sha'])
-                            all_commits.append(commit)
-            else:
+            with Progress(len(diverged_branches), f"Branches in {repo_name}", enabled=self.verbose) as progress:
                 for future in as_completed(future_to_branch):
-                    branch_commits = future.result()
-                    # Deduplicate commits
-                    for commit in branch_commits:
-                        if commit['sha'] not in seen_shas:
-                            seen_shas.add(commit['sha'])
-                            all_commits.append(commit)
+                    all_commits.extend(future.result())
+                    progress.tick()
+                    
+                    if len(all_commits) >= max_commits:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+        
+        if len(all_commits) >= max_commits:
+            all_commits = all_commits[:max_commits]
+            self._print(f"  Reached the limit of {max_commits} commits for {repo_name}; stopping early")
+        
+        # Drop the bulky API metadata (URLs, user objects, parents) unless full details were requested
+        if not self.keep_commit_details:
+            all_commits = [_slim_commit(commit) for commit in all_commits]
         
         # Fetch stats in parallel if requested
         if include_stats and all_commits:
-            all_commits = self.get_commit_stats_batch(repo_name, all_commits)
+            all_commits = self.add_commit_stats(repo_name, all_commits, owner)
         
         return all_commits
     
+    def add_commit_stats(self, repo_name: str, commits: List[Dict], owner: Optional[str] = None) -> List[Dict]:
+        """Attach line statistics to commits, skipping automated commits unless configured otherwise."""
+        if self.include_auto_commits:
+            return self.get_commit_stats_batch(repo_name, commits, owner)
+        
+        # Automated commits (merges, dependency bumps) count as commits but not as lines
+        interesting, automated = partition_auto_commits(commits)
+        if automated:
+            self.api_client._verbose_print(f"Skipping stats for {len(automated)} automated commits in {repo_name}")
+        for commit in automated:
+            commit['stats'] = {'total': 0, 'additions': 0, 'deletions': 0}
+            if self.include_files:
+                commit['files'] = []
+        return self.get_commit_stats_batch(repo_name, interesting, owner) + automated
+    
+    def collect_repo_commits(self, repos: List[Dict], username: str, since: str, until: str,
+                             include_lines: bool = False, max_commits: int = 1000,
+                             desc: str = "Processing repositories",
+                             global_seen: Optional[Set[int]] = None) -> Dict[str, List[Dict]]:
+        """Collect commits for every repository, pipelining branch listing and stats fetching across repos.
+        
+        Stage one lists each repository's commits; as soon as a repository finishes, its stats
+        are fetched by stage two while other repositories are still being listed. When global_seen
+        is given, commits already collected from another repository are dropped before stats are fetched;
+        repositories are then deduplicated in a fixed order (non-forks first, then listing order), so a
+        commit shared with a fork is always attributed to the same repository.
+        """
+        repo_commits = {}
+        progress = tqdm(total=len(repos), desc=desc) if self.verbose else None
+        
+        with ThreadPoolExecutor(max_workers=4) as commit_executor, ThreadPoolExecutor(max_workers=4) as stats_executor:
+            commit_futures = {
+                commit_executor.submit(self.get_user_commits_in_repo, repo['name'], username, since, until, False,
+                                       repo.get('default_branch'), max_commits, repo['owner']['login']): repo
+                for repo in repos
+            }
+            
+            if global_seen is None:
+                listed = ((future, commit_futures[future]) for future in as_completed(commit_futures))
+            else:
+                listed = sorted(commit_futures.items(), key=lambda item: bool(item[1].get('fork')))
+            
+            stats_futures = {}
+            for future, repo in listed:
+                commits = future.result()
+                if global_seen is not None:
+                    unique_commits = []
+                    for commit in commits:
+                        key = _sha_key(commit)
+                        if key not in global_seen:
+                            global_seen.add(key)
+                            unique_commits.append(commit)
+                    if len(unique_commits) < len(commits):
+                        self.api_client._verbose_print(f"Dropped {len(commits) - len(unique_commits)} commits in {repo['name']} already counted in another repository")
+                    commits = unique_commits
+                
+                if include_lines and commits:
+                    stats_futures[stats_executor.submit(self.add_commit_stats, repo['name'], commits,
+                                                        repo['owner']['login'])] = repo
+                else:
+                    repo_commits[repo['name']] = commits
+                    if progress:
+                        progress.update()
+            
+            for future in as_completed(stats_futures):
+                repo_commits[stats_futures[future]['name']] = future.result()
+                if progress:
+                    progress.update()
+        
+        if progress:
+            progress.close()
+        return repo_commits
+    
     def track_user_productivity(self, username: str, timeframe: str, 
                               custom_start: str = None, custom_end: str = None, 
                               include_prs: bool = False, include_reviews: bool = False, 
                               include_issues: bool = False, include_lines: bool = False,
-                              repoignore_path: str = '.repoignore') -> Dict:
-        """Track user productivity across all organization repositories."""
+                              repoignore_path: str = '.repoignore', max_commits: int = 1000,
+                              dates: Optional[tuple] = None) -> Dict:
+        """Track user productivity across all organization repositories.
+        
+        dates is an already resolved (since, until) pair, used instead of resolving the timeframe again.
+        """
         try:
-            since, until = get_timeframe_dates(timeframe, custom_start, custom_end)
+            since, until = dates or get_timeframe_dates(timeframe, custom_start, custom_end)
         except ValueError as e:
             print(f"Error: {e}")
             return {}
         
+        since_date, until_date = since[:10], until[:10]
+        
         print(f"Tracking productivity for {username} from {since} to {until}")
         print(f"Fetching repositories for organization: {self.org_name}")
         
@@ -118,25 +298,24 @@ class ProductivityTracker:
             return {}
         
         # Filter repositories based on .repoignore
-        repos = filter_repositories(repos, repoignore_path, self.verbose)
+        repos = self._filter_repos(repos, repoignore_path)
         
         print(f"Found {len(repos)} repositories. Analyzing commits...")
         
         productivity_data = {}
         total_commits = 0
+        all_additions = all_deletions = all_changes = 0
         
-        # Process repositories with optional progress bar
-        if self.verbose:
-            repo_iterator = tqdm(repos, desc="Processing repositories")
-        else:
-            repo_iterator = repos
+        # Process repositories concurrently, with optional progress bar
+        repo_commits = self.collect_repo_commits(repos, username, since, until, include_lines, max_commits,
+                                                 "Processing repositories")
         
-        for repo in repo_iterator:
+        for repo in repos:
             repo_name = repo['name']
             if not self.verbose:
                 print(f"Analyzing repository: {repo_name}")
             
-            commits = self.get_user_commits_in_repo(repo_name, username, since, until, include_lines)
+            commits = repo_commits.get(repo_name, [])
             
             if commits:
                 repo_data = {
@@ -147,9 +326,10 @@ class ProductivityTracker:
                 
                 # Calculate line statistics if requested
                 if include_lines:
-                    total_additions = sum(commit.get('stats', {}).get('additions', 0) for commit in commits)
-                    total_deletions = sum(commit.get('stats', {}).get('deletions', 0) for commit in commits)
-                    total_changes = sum(commit.get('stats', {}).get('total', 0) for commit in commits)
+                    total_additions, total_deletions, total_changes = _sum_line_stats(commits)
+                    all_additions += total_additions
+                    all_deletions += total_deletions
+                    all_changes += total_changes
                     
                     repo_data.update({
                         'lines_added': total_additions,
@@ -180,43 +360,36 @@ class ProductivityTracker:
         
         # Add total line statistics if requested
         if include_lines:
-            total_additions = sum(repo.get('lines_added', 0) for repo in productivity_data.values())
-            total_deletions = sum(repo.get('lines_deleted', 0) for repo in productivity_data.values())
-            total_changes = sum(repo.get('lines_changed', 0) for repo in productivity_data.values())
-            
             result['line_stats'] = {
-                'total_additions': total_additions,
-                'total_deletions': total_deletions,
-                'total_changes': total_changes
+                'total_additions': all_additions,
+                'total_deletions': all_deletions,
+                'total_changes': all_changes
             }
         
-        # Add additional metrics if requested
+        # Add additional metrics if requested; the searches are independent so run them concurrently
+        # (they share the search API budget, whose limiter only paces requests once it is nearly spent)
+        searches = {}
         if include_prs:
-            print("Fetching pull requests...")
-            prs = self.api_client.search_pull_requests(username, self.org_name, since[:10], until[:10])
-            result['pull_requests'] = {
-                'total': len(prs),
-                'data': prs
-            }
-            print(f"Found {len(prs)} pull requests")
-        
+            searches['pull_requests'] = (self.api_client.search_pull_requests, "pull requests", "pull requests")
         if include_reviews:
-            print("Fetching code reviews...")
-            reviews = self.api_client.search_code_reviews(username, self.org_name, since[:10], until[:10])
-            result['code_reviews'] = {
-                'total': len(reviews),
-                'data': reviews
-            }
-            print(f"Found {len(reviews)} code reviews")
-        
+            searches['code_reviews'] = (self.api_client.search_code_reviews, "code reviews", "code reviews")
         if include_issues:
-            print("Fetching issues...")
-            issues = self.api_client.search_issues(username, self.org_name, since[:10], until[:10])
-            result['issues'] = {
-                'total': len(issues),
-                'data': issues
-            }
-            print(f"Found {len(issues)} issues created")
+            searches['issues'] = (self.api_client.search_issues, "issues", "issues created")
+        
+        if searches:
+            with ThreadPoolExecutor(max_workers=len(searches)) as executor:
+                futures = {}
+                for key, (search, label, _) in searches.items():
+                    print(f"Fetching {label}...")
+                    futures[key] = executor.submit(search, username, self.org_name, since_date, until_date)
+                
+                for key, future in futures.items():
+                    items = future.result()
+                    result[key] = {
+                        'total': len(items),
+                        'data': items
+                    }
+                    print(f"Found {len(items)} {searches[key][2]}")
         
         return result
     
@@ -224,10 +397,14 @@ class ProductivityTracker:
                                        custom_start: str = None, custom_end: str = None,
                                        include_prs: bool = False, include_reviews: bool = False,
                                        include_issues: bool = False, include_lines: bool = False,
-                                       repoignore_path: str = ".repoignore") -> Dict:
-        """Track user productivity across their personal repositories."""
+                                       repoignore_path: str = ".repoignore", max_commits: int = 1000,
+                                       dates: Optional[tuple] = None) -> Dict:
+        """Track user productivity across their personal repositories.
+
+        dates is an already resolved (since, until) pair, used instead of resolving the timeframe again.
+        """
         try:
-            since, until = get_timeframe_dates(timeframe, custom_start, custom_end)
+            since, until = dates or get_timeframe_dates(timeframe, custom_start, custom_end)
         except ValueError as e:
             print(f"Error: {e}")
             return {}
@@ -235,70 +412,66 @@ class ProductivityTracker:
         print(f"\nTracking PERSONAL productivity for {username} from {since} to {until}")
         print(f"Fetching personal repositories for user: {username}")
 
-        original_org = self.org_name
-
-        try:
-            repos = self.api_client.get_user_personal_repos(username)
-            if not repos:
-                print("No personal repositories found or error fetching repositories.")
-                return {}
-
-            repos = filter_repositories(repos, repoignore_path, self.verbose)
-            print(f"Analyzing {len(repos)} personal repositories...")
+        repos = self.api_client.get_user_personal_repos(username)
+        if not repos:
+            print("No personal repositories found or error fetching repositories.")
+            return {}
 
-            productivity_data = {}
-            total_commits = 0
+        repos = self._filter_repos(repos, repoignore_path)
+        print(f"Analyzing {len(repos)} personal repositories...")
 
-            if self.verbose:
-                repo_iterator = tqdm(repos, desc="Processing personal repositories")
-            else:
-                repo_iterator = repos
+        productivity_data = {}
+        total_commits = 0
+        all_additions = all_deletions = all_changes = 0
 
-            for repo in repo_iterator:
-                repo_name = repo["name"]
-                repo_owner = repo["owner"]["login"]
-                self.org_name = repo_owner
+        # Each repository is queried under its own owner, so no shared state is mutated.
+        # Forks share history with their source, so each commit is only counted once across repositories.
+        global_seen: Set[int] = set()
+        repo_commits = self.collect_repo_commits(repos, username, since, until, include_lines, max_commits,
+                                                 "Processing personal repositories", global_seen)
 
-                if not self.verbose:
-                    print(f"Analyzing personal repository: {repo_name}")
+        for repo in repos:
+            repo_name = repo["name"]
 
-                commits = self.get_user_commits_in_repo(repo_name, username, since, until, include_lines)
+            if not self.verbose:
+                print(f"Analyzing personal repository: {repo_name}")
 
-                if commits:
-                    repo_data = {
-                        "commit_count": len(commits),
-                        "commits": commits,
-                        "repo_url": repo["html_url"],
-                        "is_fork": repo.get("fork", False),
-                        "is_private": repo.get("private", False)
-                    }
+            commits = repo_commits.get(repo_name, [])
 
-                    if include_lines:
-                        total_additions = sum(commit.get("stats", {}).get("additions", 0) for commit in commits)
-                        total_deletions = sum(commit.get("stats", {}).get("deletions", 0) for commit in commits)
-                        total_changes = sum(commit.get("stats", {}).get("total", 0) for commit in commits)
+            if commits:
+                repo_data = {
+                    "commit_count": len(commits),
+                    "commits": commits,
+                    "repo_url": repo["html_url"],
+                    "is_fork": repo.get("fork", False),
+                    "is_private": repo.get("private", False)
+                }
 
-                        repo_data.update({
-                            "lines_added": total_additions,
-                            "lines_deleted": total_deletions,
-                            "lines_changed": total_changes
-                        })
+                if include_lines:
+                    total_additions, total_deletions, total_changes = _sum_line_stats(commits)
+                    all_additions += total_additions
+                    all_deletions += total_deletions
+                    all_changes += total_changes
 
-                        fork_indicator = " (fork)" if repo.get("fork", False) else ""
-                        private_indicator = " (private)" if repo.get("private", False) else ""
-                        print(f"  Found {len(commits)} commits (+{total_additions}/-{total_deletions} lines){fork_indicator}{private_indicator}")
-                    else:
-                        fork_indicator = " (fork)" if repo.get("fork", False) else ""
-                        private_indicator = " (private)" if repo.get("private", False) else ""
-                        print(f"  Found {len(commits)} commits{fork_indicator}{private_indicator}")
+                    repo_data.update({
+                        "lines_added": total_additions,
+                        "lines_deleted": total_deletions,
+                        "lines_changed": total_changes
+                    })
 
-                    productivity_data[repo_name] = repo_data
-                    total_commits += len(commits)
+                    fork_indicator = " (fork)" if repo.get("fork", False) else ""
+                    private_indicator = " (private)" if repo.get("private", False) else ""
+                    print(f"  Found {len(commits)} commits (+{total_additions}/-{total_deletions} lines){fork_indicator}{private_indicator}")
                 else:
-                    print(f"  No commits found")
+                    fork_indicator = " (fork)" if repo.get("fork", False) else ""
+                    private_indicator = " (private)" if repo.get("private", False) else ""
+                    print(f"  Found {len(commits)} commits{fork_indicator}{private_indicator}")
+
+                productivity_data[repo_name] = repo_data
+                total_commits += len(commits)
+            else:
+                print(f"  No commits found")
 
-        finally:
-            self.org_name = original_org
 
         result = {
             "username": username,
@@ -313,14 +486,10 @@ class ProductivityTracker:
         }
 
         if include_lines:
-            total_additions = sum(repo.get("lines_added", 0) for repo in productivity_data.values())
-            total_deletions = sum(repo.get("lines_deleted", 0) for repo in productivity_data.values())
-            total_changes = sum(repo.get("lines_changed", 0) for repo in productivity_data.values())
-
             result["line_stats"] = {
-                "total_additions": total_additions,
-                "total_deletions": total_deletions,
-                "total_changes": total_changes
+                "total_additions": all_additions,
+                "total_deletions": all_deletions,
+                "total_changes": all_changes
             }
 
         return result
@@ -329,20 +498,27 @@ class ProductivityTracker:
                                        custom_start: str = None, custom_end: str = None,
                                        include_prs: bool = False, include_reviews: bool = False,
                                        include_issues: bool = False, include_lines: bool = False,
-                                       repoignore_path: str = ".repoignore") -> Dict:
+                                       repoignore_path: str = ".repoignore", max_commits: int = 1000) -> Dict:
         """Compare productivity between personal and organization repositories."""
         print(f"Comparing personal vs organization productivity for {username}...")
         
+        # Resolve the window once, so both sides cover exactly the same period
+        try:
+            dates = get_timeframe_dates(timeframe, custom_start, custom_end)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return {}
+        
         # Track organization productivity
         org_data = self.track_user_productivity(
             username, timeframe, custom_start, custom_end,
-            include_prs, include_reviews, include_issues, include_lines, repoignore_path
+            include_prs, include_reviews, include_issues, include_lines, repoignore_path, max_commits, dates
         )
         
         # Track personal productivity
         personal_data = self.track_user_personal_productivity(
             username, timeframe, custom_start, custom_end,
-            include_prs, include_reviews, include_issues, include_lines, repoignore_path
+            include_prs, include_reviews, include_issues, include_lines, repoignore_path, max_commits, dates
         )
         
         # Create comparison data structure
@@ -0,0 +1,49 @@
+"""
+Lightweight progress counter for hot loops.
+"""
+
+import sys
+import time
+from typing import Optional, TextIO
+
+
+class Progress:
+    """Integer progress counter that redraws at most once per interval."""
+
+    def __init__(self, total: int, desc: str = '', enabled: bool = True,
+                 interval: float = 0.1, stream: Optional[TextIO] = None):
+        self.total = total
+        self.desc = desc
+        self.enabled = enabled
+        self.interval = interval
+        self.stream = stream or sys.stderr
+        self.count = 0
+        self._last_draw = 0.0
+
+    def __enter__(self) -> 'Progress':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def tick(self, n: int = 1):
+        """Advance the counter, redrawing only if the interval has elapsed."""
+        self.count += n
+        if not self.enabled:
+            return
+
+        now = time.monotonic()
+        if now - self._last_draw >= self.interval:
+            self._last_draw = now
+            self._draw()
+
+    def close(self):
+        """Draw the final state and end the line."""
+        if self.enabled:
+            self._draw()
+            self.stream.write('\n')
+            self.stream.flush()
+
+    def _draw(self):
+        self.stream.write(f"\r{self.desc}: {self.count}/{self.total}")
+        self.stream.flush()
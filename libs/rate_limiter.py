@@ -0,0 +1,71 @@
+"""
+Process-wide rate limiter driven by GitHub's rate limit response headers.
+"""
+
+import random
+import threading
+import time
+from typing import Mapping, Optional
+
+
+class RateLimiter:
+    """Thread-safe request pacer shared by every worker using the same API budget."""
+
+    def __init__(self, remaining: int = 5000, low_watermark_ratio: float = 0.02):
+        self._lock = threading.Lock()
+        self.limit = remaining
+        self.remaining = remaining
+        self.reset_at = 0.0
+        self.backoff_until = 0.0
+        self.low_watermark_ratio = low_watermark_ratio
+        self._next_slot = 0.0
+
+    @property
+    def low_watermark(self) -> int:
+        """Remaining budget below which requests are paced: a fraction of the window's limit."""
+        return max(1, int(self.limit * self.low_watermark_ratio))
+
+    def acquire(self) -> float:
+        """Block until a request may be sent. Returns the number of seconds waited."""
+        with self._lock:
+            now = time.time()
+            start = max(now, self.backoff_until, self._next_slot)
+
+            if self.reset_at > now:
+                if self.remaining <= 0:
+                    # Budget exhausted: hold everyone until the window resets
+                    start = max(start, self.reset_at + 1)
+                elif self.remaining < self.low_watermark:
+                    # Budget thinning: spread the remaining requests over the window
+                    self._next_slot = start + (self.reset_at - now) / self.remaining
+
+            if self.remaining > 0:
+                self.remaining -= 1
+
+        wait_time = start - now
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+    def update(self, headers: Mapping[str, str]):
+        """Refresh the budget from X-RateLimit-* response headers."""
+        limit = headers.get('X-RateLimit-Limit')
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+
+        with self._lock:
+            if limit is not None:
+                self.limit = int(limit)
+            if remaining is not None:
+                self.remaining = int(remaining)
+            if reset is not None:
+                self.reset_at = float(reset)
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Pause all callers after a rejected request. Returns the backoff delay in seconds."""
+        if retry_after is None:
+            retry_after = 2 ** attempt + random.uniform(0, 1)
+
+        with self._lock:
+            self.backoff_until = max(self.backoff_until, time.time() + retry_after)
+        return retry_after
@@ -2,9 +2,78 @@
 Report generation functions for productivity data.
 """
 
+import bisect
+import functools
 import os
+import sys
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+_EQ80 = "=" * 80
+_DASH80 = "-" * 80
+_DASH50 = "-" * 50
+
+# Average commits per day at which each productivity level starts
+_PROD_THRESH = (1, 3, 5)
+_PROD_LEVELS = ("Low", "Moderate", "High", "Very High")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(iso: str) -> datetime:
+    """Parse an ISO-8601 timestamp, accepting a trailing 'Z'."""
+    # fromisoformat only understands 'Z' from Python 3.11 on
+    if iso[-1] == 'Z':
+        iso = iso[:-1] + '+00:00'
+    return datetime.fromisoformat(iso)
+
+
+@functools.lru_cache(maxsize=1024)
+def _fmt_human(iso: str) -> str:
+    """Format an ISO-8601 timestamp for humans, e.g. 'January 01, 2024'."""
+    return _parse_iso(iso).strftime('%B %d, %Y')
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_int(n: int) -> str:
+    """Format an integer with thousands separators, e.g. '12,345'."""
+    return f"{n:,}"
+
+
+def _sorted_repos(repositories: Dict) -> List[tuple]:
+    """Return (name, repo_data) pairs by commit count descending, ties by name."""
+    # Negated counts sort ascending with plain tuple comparison, no key function needed
+    items = [(-repo_data['commit_count'], name, repo_data) for name, repo_data in repositories.items()]
+    items.sort()
+    return [(name, repo_data) for _, name, repo_data in items]
+
+
+def _triplet(label: str, node: Dict) -> str:
+    """Format one organization/personal/difference comparison block, blank line included."""
+    return (f"{label}:\n"
+            f"  Organization: {node['organization']}\n"
+            f"  Personal:     {node['personal']}\n"
+            f"  Difference:   {node['difference']:+d}\n")
+
+
+def _emit_header(out: List[str], banner: str, data: Dict, org_label: Optional[str] = None) -> bool:
+    """Append the report banner and, when a timeframe is known, the user/scope/timeframe lines.
+
+    Returns True if the timeframe lines were written.
+    """
+    out.extend(("\\n" + _EQ80, banner, _EQ80))
+    timeframe = data.get('timeframe') or {}
+    if timeframe.get('since') and timeframe.get('until'):
+        out.append(f"User: {data['username']}")
+        if org_label:
+            out.append(org_label)
+        out.append(f"Timeframe: {_fmt_human(timeframe['since'])} to {_fmt_human(timeframe['until'])}")
+        return True
+    return False
+
+
+def _render(lines: List[str]):
+    """Emit report lines to stdout with a single write."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def display_productivity_report(data: Dict):
@@ -12,54 +81,55 @@ def display_productivity_report(data: Dict):
     if not data:
         print("No data to display.")
         return
+    if (not data.get('total_commits') and not data.get('repositories')
+            and not any(data.get(key, {}).get('total') for key in ('pull_requests', 'code_reviews', 'issues'))):
+        print("No activity in selected timeframe.")
+        return
     
-    print("\\n" + "="*80)
-    print(f"PRODUCTIVITY REPORT")
-    print("="*80)
-    # Format timeframe for human readability
-    since_date = datetime.fromisoformat(data['timeframe']['since'].replace('Z', '+00:00'))
-    until_date = datetime.fromisoformat(data['timeframe']['until'].replace('Z', '+00:00'))
-    
-    print(f"User: {data['username']}")
-    print(f"Organization: {data['organization']}")
-    print(f"Timeframe: {since_date.strftime('%B %d, %Y')} to {until_date.strftime('%B %d, %Y')}")
-    print(f"Total Commits: {data['total_commits']}")
-    print(f"Repositories with activity: {len(data['repositories'])}")
+    out = []
+    _emit_header(out, "PRODUCTIVITY REPORT", data, f"Organization: {data['organization']}")
+    out.append(f"Total Commits: {data['total_commits']}")
+    out.append(f"Repositories with activity: {len(data['repositories'])}")
     
     # Display additional metrics if available
-    if 'pull_requests' in data:
-        print(f"Pull Requests Created: {data['pull_requests']['total']}")
-    if 'code_reviews' in data:
-        print(f"Code Reviews Performed: {data['code_reviews']['total']}")
-    if 'issues' in data:
-        print(f"Issues Created: {data['issues']['total']}")
-    if 'line_stats' in data:
-        stats = data['line_stats']
-        print(f"Lines Modified: +{stats['total_additions']}/-{stats['total_deletions']} ({stats['total_changes']} total)")
+    pr = data.get('pull_requests')
+    if pr:
+        out.append(f"Pull Requests Created: {pr['total']}")
+    reviews = data.get('code_reviews')
+    if reviews:
+        out.append(f"Code Reviews Performed: {reviews['total']}")
+    issues = data.get('issues')
+    if issues:
+        out.append(f"Issues Created: {issues['total']}")
+    stats = data.get('line_stats')
+    if stats:
+        out.append(f"Lines Modified: +{stats['total_additions']}/-{stats['total_deletions']} ({stats['total_changes']} total)")
     
     if data['repositories']:
-        print("\\nPER REPOSITORY BREAKDOWN:")
-        print("-" * 80)
+        out.append("\\nPER REPOSITORY BREAKDOWN:")
+        out.append(_DASH80)
         
         # Sort repositories by commit count (descending)
-        sorted_repos = sorted(data['repositories'].items(), 
-                            key=lambda x: x[1]['commit_count'], reverse=True)
+        sorted_repos = _sorted_repos(data['repositories'])
         
         for repo_name, repo_data in sorted_repos:
-            print(f"\\n{repo_name}: {repo_data['commit_count']} commits")
-            print(f"  Repository: {repo_data['repo_url']}")
+            out.extend((f"\\n{repo_name}: {repo_data['commit_count']} commits",
+                        f"  Repository: {repo_data['repo_url']}"))
             
             # Show recent commits (limit to 5)
-            recent_commits = repo_data['commits'][:5]
+            commits = repo_data['commits']
+            recent_commits = commits[:5]
+            n_commits = len(commits)
             for commit in recent_commits:
-                date = commit['commit']['author']['date']
-                message = commit['commit']['message'].split('\\n')[0][:60]
-                print(f"    {date[:10]} - {message}")
+                c = commit['commit']
+                # First line of the message only (chr(10) since f-string expressions cannot hold backslashes)
+                out.append(f"    {c['author']['date'][:10]} - {c['message'].partition(chr(10))[0][:60]}")
             
-            if len(repo_data['commits']) > 5:
-                print(f"    ... and {len(repo_data['commits']) - 5} more commits")
+            if n_commits > 5:
+                out.append(f"    ... and {n_commits - 5} more commits")
     
-    print("\\n" + "="*80)
+    out.append("\\n" + _EQ80)
+    _render(out)
 
 
 def display_personal_report(data: Dict):
@@ -67,50 +137,47 @@ def display_personal_report(data: Dict):
     if not data:
         print("No data to display.")
         return
+    if not data.get('total_commits') and not data.get('repositories'):
+        print("No activity in selected timeframe.")
+        return
     
-    print("\\n" + "="*80)
-    print(f"PERSONAL PRODUCTIVITY REPORT")
-    print("="*80)
-    # Format timeframe for human readability
-    since_date = datetime.fromisoformat(data['timeframe']['since'].replace('Z', '+00:00'))
-    until_date = datetime.fromisoformat(data['timeframe']['until'].replace('Z', '+00:00'))
-    
-    print(f"User: {data['username']}")
-    print(f"Scope: Personal Repositories")
-    print(f"Timeframe: {since_date.strftime('%B %d, %Y')} to {until_date.strftime('%B %d, %Y')}")
-    print(f"Total Commits: {data['total_commits']}")
-    print(f"Repositories with activity: {len(data['repositories'])}")
+    out = []
+    _emit_header(out, "PERSONAL PRODUCTIVITY REPORT", data, "Scope: Personal Repositories")
+    out.append(f"Total Commits: {data['total_commits']}")
+    out.append(f"Repositories with activity: {len(data['repositories'])}")
     
     # Display additional metrics if available
-    if 'line_stats' in data:
-        stats = data['line_stats']
-        print(f"Lines Modified: +{stats['total_additions']}/-{stats['total_deletions']} ({stats['total_changes']} total)")
+    stats = data.get('line_stats')
+    if stats:
+        out.append(f"Lines Modified: +{stats['total_additions']}/-{stats['total_deletions']} ({stats['total_changes']} total)")
     
     if data['repositories']:
-        print("\\nPER REPOSITORY BREAKDOWN:")
-        print("-" * 80)
+        out.append("\\nPER REPOSITORY BREAKDOWN:")
+        out.append(_DASH80)
         
         # Sort repositories by commit count (descending)
-        sorted_repos = sorted(data['repositories'].items(), 
-                            key=lambda x: x[1]['commit_count'], reverse=True)
+        sorted_repos = _sorted_repos(data['repositories'])
         
         for repo_name, repo_data in sorted_repos:
             fork_indicator = " (fork)" if repo_data.get('is_fork', False) else ""
             private_indicator = " (private)" if repo_data.get('is_private', False) else ""
-            print(f"\\n{repo_name}: {repo_data['commit_count']} commits{fork_indicator}{private_indicator}")
-            print(f"  Repository: {repo_data['repo_url']}")
+            out.extend((f"\\n{repo_name}: {repo_data['commit_count']} commits{fork_indicator}{private_indicator}",
+                        f"  Repository: {repo_data['repo_url']}"))
             
             # Show recent commits (limit to 5)
-            recent_commits = repo_data['commits'][:5]
+            commits = repo_data['commits']
+            recent_commits = commits[:5]
+            n_commits = len(commits)
             for commit in recent_commits:
-                date = commit['commit']['author']['date']
-                message = commit['commit']['message'].split('\\n')[0][:60]
-                print(f"    {date[:10]} - {message}")
+                c = commit['commit']
+                # First line of the message only (chr(10) since f-string expressions cannot hold backslashes)
+                out.append(f"    {c['author']['date'][:10]} - {c['message'].partition(chr(10))[0][:60]}")
             
-            if len(repo_data['commits']) > 5:
-                print(f"    ... and {len(repo_data['commits']) - 5} more commits")
+            if n_commits > 5:
+                out.append(f"    ... and {n_commits - 5} more commits")
     
-    print("\\n" + "="*80)
+    out.append("\\n" + _EQ80)
+    _render(out)
 
 
 def display_comparison_report(comparison_data: Dict):
@@ -119,78 +186,49 @@ def display_comparison_report(comparison_data: Dict):
         print("No comparison data to display.")
         return
     
-    print("\\n" + "="*80)
-    print("PERSONAL VS ORGANIZATION PRODUCTIVITY COMPARISON")
-    print("="*80)
-    
-    # Format timeframe for human readability
-    timeframe = comparison_data.get('timeframe', {})
-    if timeframe.get('since') and timeframe.get('until'):
-        since_date = datetime.fromisoformat(timeframe['since'].replace('Z', '+00:00'))
-        until_date = datetime.fromisoformat(timeframe['until'].replace('Z', '+00:00'))
-        
-        print(f"User: {comparison_data['username']}")
-        print(f"Organization: {comparison_data['organization']['name']}")
-        print(f"Timeframe: {since_date.strftime('%B %d, %Y')} to {until_date.strftime('%B %d, %Y')}")
-        print()
+    out = []
+    if _emit_header(out, "PERSONAL VS ORGANIZATION PRODUCTIVITY COMPARISON", comparison_data,
+                    f"Organization: {comparison_data['organization']['name']}"):
+        out.append("")
     
     # Display comparison metrics
     comp = comparison_data['comparison']
     
-    print("COMMITS COMPARISON:")
-    print(f"  Organization: {comp['total_commits']['organization']}")
-    print(f"  Personal:     {comp['total_commits']['personal']}")
-    print(f"  Difference:   {comp['total_commits']['difference']:+d}")
-    print()
-    
-    print("ACTIVE REPOSITORIES:")
-    print(f"  Organization: {comp['active_repositories']['organization']}")
-    print(f"  Personal:     {comp['active_repositories']['personal']}")
-    print(f"  Difference:   {comp['active_repositories']['difference']:+d}")
-    print()
+    out.append(_triplet("COMMITS COMPARISON", comp['total_commits']))
+    out.append(_triplet("ACTIVE REPOSITORIES", comp['active_repositories']))
     
     # Display line stats if available
-    if 'line_stats' in comp:
-        line_stats = comp['line_stats']
-        print("LINES OF CODE COMPARISON:")
-        print(f"  Lines Added:")
-        print(f"    Organization: +{line_stats['organization'].get('total_additions', 0):,}")
-        print(f"    Personal:     +{line_stats['personal'].get('total_additions', 0):,}")
-        print(f"    Difference:   {line_stats['difference']['total_additions']:+,}")
-        print(f"  Lines Deleted:")
-        print(f"    Organization: -{line_stats['organization'].get('total_deletions', 0):,}")
-        print(f"    Personal:     -{line_stats['personal'].get('total_deletions', 0):,}")
-        print(f"    Difference:   {line_stats['difference']['total_deletions']:+,}")
-        print(f"  Total Changes:")
-        print(f"    Organization: {line_stats['organization'].get('total_changes', 0):,}")
-        print(f"    Personal:     {line_stats['personal'].get('total_changes', 0):,}")
-        print(f"    Difference:   {line_stats['difference']['total_changes']:+,}")
-        print()
+    line_stats = comp.get('line_stats')
+    if line_stats:
+        org = line_stats['organization']
+        per = line_stats['personal']
+        dif = line_stats['difference']
+        out.append("LINES OF CODE COMPARISON:\n"
+                   "  Lines Added:\n"
+                   f"    Organization: +{_fmt_int(org.get('total_additions', 0))}\n"
+                   f"    Personal:     +{_fmt_int(per.get('total_additions', 0))}\n"
+                   f"    Difference:   {dif['total_additions']:+,}\n"
+                   "  Lines Deleted:\n"
+                   f"    Organization: -{_fmt_int(org.get('total_deletions', 0))}\n"
+                   f"    Personal:     -{_fmt_int(per.get('total_deletions', 0))}\n"
+                   f"    Difference:   {dif['total_deletions']:+,}\n"
+                   "  Total Changes:\n"
+                   f"    Organization: {_fmt_int(org.get('total_changes', 0))}\n"
+                   f"    Personal:     {_fmt_int(per.get('total_changes', 0))}\n"
+                   f"    Difference:   {dif['total_changes']:+,}\n")
     
     # Display additional metrics if available
-    if 'pull_requests' in comp:
-        pr_comp = comp['pull_requests']
-        print("PULL REQUESTS:")
-        print(f"  Organization: {pr_comp['organization']}")
-        print(f"  Personal:     {pr_comp['personal']}")
-        print(f"  Difference:   {pr_comp['difference']:+d}")
-        print()
+    pr_comp = comp.get('pull_requests')
+    if pr_comp:
+        out.append(_triplet("PULL REQUESTS", pr_comp))
     
-    if 'code_reviews' in comp:
-        review_comp = comp['code_reviews']
-        print("CODE REVIEWS:")
-        print(f"  Organization: {review_comp['organization']}")
-        print(f"  Personal:     {review_comp['personal']}")
-        print(f"  Difference:   {review_comp['difference']:+d}")
-        print()
+    review_comp = comp.get('code_reviews')
+    if review_comp:
+        out.append(_triplet("CODE REVIEWS", review_comp))
     
-    if 'issues' in comp:
-        issue_comp = comp['issues']
-        print("ISSUES CREATED:")
-        print(f"  Organization: {issue_comp['organization']}")
-        print(f"  Personal:     {issue_comp['personal']}")
-        print(f"  Difference:   {issue_comp['difference']:+d}")
-        print()
+    issue_comp = comp.get('issues')
+    if issue_comp:
+        out.append(_triplet("ISSUES CREATED", issue_comp))
     
     # Summary
     total_org_activity = comp['total_commits']['organization']
@@ -201,11 +239,12 @@ def display_comparison_report(comparison_data: Dict):
         org_percentage = (total_org_activity / total_activity) * 100
         personal_percentage = (total_personal_activity / total_activity) * 100
         
-        print("ACTIVITY DISTRIBUTION:")
-        print(f"  Organization: {org_percentage:.1f}% ({total_org_activity}/{total_activity})")
-        print(f"  Personal:     {personal_percentage:.1f}% ({total_personal_activity}/{total_activity})")
+        out.append("ACTIVITY DISTRIBUTION:")
+        out.append(f"  Organization: {org_percentage:.1f}% ({total_org_activity}/{total_activity})")
+        out.append(f"  Personal:     {personal_percentage:.1f}% ({total_personal_activity}/{total_activity})")
     
-    print("\\n" + "="*80)
+    out.append("\\n" + _EQ80)
+    _render(out)
 
 
 def generate_text_summary(data: Dict, output_dir: str) -> str:
@@ -213,83 +252,89 @@ def generate_text_summary(data: Dict, output_dir: str) -> str:
     if not data:
         return ""
 
-    timestamp = datetime.now().strftime("%Y-%m-%d")
+    now = datetime.now()
+    timestamp = now.strftime("%Y-%m-%d")
     summary_path = os.path.join(output_dir, f"productivity_summary_{data['username']}_{timestamp}.txt")
 
     # Format timeframe for human readability
-    since_date = datetime.fromisoformat(data['timeframe']['since'].replace('Z', '+00:00'))
-    until_date = datetime.fromisoformat(data['timeframe']['until'].replace('Z', '+00:00'))
-
-    with open(summary_path, "w") as f:
-        f.write("=" * 80 + "\\n")
-        f.write("GITHUB PRODUCTIVITY ANALYSIS SUMMARY\\n")
-        f.write("=" * 80 + "\\n\\n")
-
-        # Basic Information
-        f.write(f"User: {data['username']}\\n")
-        f.write(f"Organization: {data['organization']}\\n")
-        f.write(f"Analysis Period: {since_date.strftime('%B %d, %Y')} to {until_date.strftime('%B %d, %Y')}\\n")
-        f.write(f"Report Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}\\n\\n")
-
-        # Overall Metrics
-        f.write("-" * 50 + "\\n")
-        f.write("OVERALL PRODUCTIVITY METRICS\\n")
-        f.write("-" * 50 + "\\n")
-        f.write(f"Total Commits: {data['total_commits']}\\n")
-        f.write(f"Active Repositories: {len(data['repositories'])}\\n")
-
-        if 'pull_requests' in data:
-            f.write(f"Pull Requests Created: {data['pull_requests']['total']}\\n")
-        if 'code_reviews' in data:
-            f.write(f"Code Reviews Performed: {data['code_reviews']['total']}\\n")
-        if 'issues' in data:
-            f.write(f"Issues Created: {data['issues']['total']}\\n")
-        if 'line_stats' in data:
-            stats = data['line_stats']
-            f.write(f"Lines Added: +{stats['total_additions']:,}\\n")
-            f.write(f"Lines Deleted: -{stats['total_deletions']:,}\\n")
-            f.write(f"Total Lines Modified: {stats['total_changes']:,}\\n")
-
-        # Time-based Analysis
-        f.write("\\n" + "-" * 50 + "\\n")
-        f.write("TIME-BASED ANALYSIS\\n")
-        f.write("-" * 50 + "\\n")
-
-        # Calculate daily averages
-        days_in_period = (until_date - since_date).days + 1
-        if days_in_period > 0:
-            avg_commits_per_day = data['total_commits'] / days_in_period
-            f.write(f"Analysis Period: {days_in_period} days\\n")
-            f.write(f"Average Commits per Day: {avg_commits_per_day:.1f}\\n")
-
-            if 'line_stats' in data:
-                avg_lines_per_day = data['line_stats']['total_changes'] / days_in_period
-                f.write(f"Average Lines Modified per Day: {avg_lines_per_day:.0f}\\n")
-
-        # Summary and Insights
-        f.write("\\n" + "-" * 50 + "\\n")
-        f.write("INSIGHTS AND SUMMARY\\n")
-        f.write("-" * 50 + "\\n")
-
-        if data['total_commits'] == 0:
-            f.write("No commit activity found in the specified timeframe.\\n")
-        else:
-            # Productivity level assessment
-            if avg_commits_per_day >= 5:
-                productivity_level = "Very High"
-            elif avg_commits_per_day >= 3:
-                productivity_level = "High"
-            elif avg_commits_per_day >= 1:
-                productivity_level = "Moderate"
-            else:
-                productivity_level = "Low"
-
-            f.write(f"Productivity Level: {productivity_level}\\n")
-            f.write(f"Repository Diversity: {len(data['repositories'])} different repositories\\n")
-
-        f.write("\\n" + "=" * 80 + "\\n")
-        f.write("End of Report\\n")
-        f.write("=" * 80 + "\\n")
+    since_date = _parse_iso(data['timeframe']['since'])
+    until_date = _parse_iso(data['timeframe']['until'])
+
+    buf = []
+    buf.append(_EQ80 + "\\n")
+    buf.append("GITHUB PRODUCTIVITY ANALYSIS SUMMARY\\n")
+    buf.append(_EQ80 + "\\n\\n")
+
+    # Basic Information
+    buf.append(f"User: {data['username']}\\n")
+    buf.append(f"Organization: {data['organization']}\\n")
+    buf.append(f"Analysis Period: {_fmt_human(data['timeframe']['since'])} to {_fmt_human(data['timeframe']['until'])}\\n")
+    buf.append(f"Report Generated: {now.strftime('%B %d, %Y at %I:%M %p')}\\n\\n")
+
+    # Overall Metrics
+    buf.append(_DASH50 + "\\n")
+    buf.append("OVERALL PRODUCTIVITY METRICS\\n")
+    buf.append(_DASH50 + "\\n")
+    buf.append(f"Total Commits: {data['total_commits']}\\n")
+    buf.append(f"Active Repositories: {len(data['repositories'])}\\n")
+
+    pr = data.get('pull_requests')
+    if pr:
+        buf.append(f"Pull Requests Created: {pr['total']}\\n")
+    reviews = data.get('code_reviews')
+    if reviews:
+        buf.append(f"Code Reviews Performed: {reviews['total']}\\n")
+    issues = data.get('issues')
+    if issues:
+        buf.append(f"Issues Created: {issues['total']}\\n")
+    stats = data.get('line_stats')
+    if stats:
+        buf.append(f"Lines Added: +{_fmt_int(stats['total_additions'])}\\n")
+        buf.append(f"Lines Deleted: -{_fmt_int(stats['total_deletions'])}\\n")
+        buf.append(f"Total Lines Modified: {_fmt_int(stats['total_changes'])}\\n")
+
+    # Time-based Analysis
+    buf.append("\\n" + _DASH50 + "\\n")
+    buf.append("TIME-BASED ANALYSIS\\n")
+    buf.append(_DASH50 + "\\n")
+
+    # Calculate daily averages
+    days_in_period = (until_date - since_date).days + 1
+    if days_in_period > 0:
+        avg_commits_per_day = data['total_commits'] / days_in_period
+        buf.append(f"Analysis Period: {days_in_period} days\\n")
+        buf.append(f"Average Commits per Day: {avg_commits_per_day:.1f}\\n")
+
+        if stats:
+            avg_lines_per_day = stats['total_changes'] / days_in_period
+            buf.append(f"Average Lines Modified per Day: {avg_lines_per_day:.0f}\\n")
+
+    # Summary and Insights
+    buf.append("\\n" + _DASH50 + "\\n")
+    buf.append("INSIGHTS AND SUMMARY\\n")
+    buf.append(_DASH50 + "\\n")
+
+    if data['total_commits'] == 0:
+        buf.append("No commit activity found in the specified timeframe.\\n")
+    else:
+        # Productivity level assessment
+        productivity_level = _PROD_LEVELS[bisect.bisect_right(_PROD_THRESH, avg_commits_per_day)]
+
+        buf.append(f"Productivity Level: {productivity_level}\\n")
+        buf.append(f"Repository Diversity: {len(data['repositories'])} different repositories\\n")
+
+    buf.append("\\n" + _EQ80 + "\\n")
+    buf.append("End of Report\\n")
+    buf.append(_EQ80 + "\\n")
+
+    # Encode once and hand the bytes straight to the OS, bypassing TextIOWrapper
+    payload = memoryview("".join(buf).encode("utf-8"))
+    fd = os.open(summary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload):]
+    finally:
+        os.close(fd)
 
     print(f"Text summary saved to {summary_path}")
     return summary_path
\ No newline at end of file
@@ -2,20 +2,120 @@
 Visualization functions for productivity data.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+import heapq
+import os
+
 import numpy as np
-import seaborn as sns
-from datetime import datetime, timedelta
-from collections import defaultdict, Counter
+from datetime import date, datetime
 from typing import Dict, List, Optional
-import os
 
-from .data_utils import create_output_directory
+from .data_utils import create_output_directory, extract_commit_dates, extract_commit_line_changes
+
+# Charts are saved at preview resolution unless high quality output is requested
+_PREVIEW_DPI = 150
+_HIGH_QUALITY_DPI = 300
+
+# Dashboard figures by subplot grid, reused across calls instead of being rebuilt
+_FIG_CACHE: Dict[tuple, object] = {}
+
+def _pyplot():
+    """Import pyplot on first use, so importing this module stays cheap when no chart is drawn."""
+    import matplotlib
+    # Charts are only ever written to files, so default to the headless raster backend
+    # (set MPLBACKEND to pick an interactive one instead)
+    if not os.environ.get('MPLBACKEND'):
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _parse_days(timestamps: List[str]) -> np.ndarray:
+    """Parse ISO-8601 timestamps into a datetime64[D] array from their 'YYYY-MM-DD' prefix."""
+    return np.array([ts[:10] for ts in timestamps], dtype='datetime64[D]')
+
+
+def _commit_days(repositories: Optional[Dict]) -> np.ndarray:
+    """Commit days for a repositories mapping (an empty array when there is none)."""
+    if not repositories:
+        return np.array([], dtype='datetime64[D]')
+    return extract_commit_dates(repositories)
+
+
+def _commit_arrays(repositories: Optional[Dict]):
+    """Commit days and line changes for a repositories mapping (empty arrays when there is none)."""
+    if not repositories:
+        return _commit_days(repositories), np.array([], dtype=np.int64)
+    return extract_commit_dates(repositories), extract_commit_line_changes(repositories)
+
+
+def _daily_totals(days: np.ndarray, weights: Optional[np.ndarray] = None):
+    """Collapse a datetime64[D] array into sorted unique days and per-day totals (count or summed weights)."""
+    unique_days, inverse = np.unique(days, return_inverse=True)
+    if weights is None:
+        totals = np.bincount(inverse, minlength=len(unique_days))
+    else:
+        totals = np.bincount(inverse, weights=np.asarray(weights, dtype=np.int64),
+                             minlength=len(unique_days)).astype(np.int64)
+    return unique_days, totals
+
+
+def _dashboard_figure(plt, rows: int):
+    """Return a blank (fig, axes) dashboard grid, reusing the figure of an earlier call with the same layout."""
+    key = (rows, 2)
+    fig = _FIG_CACHE.get(key)
+    if fig is None or not plt.fignum_exists(fig.number):
+        fig, axes = plt.subplots(rows, 2, figsize=(18, 4 * rows), squeeze=False, constrained_layout=True)
+        _FIG_CACHE[key] = fig
+        return fig, axes
+    
+    fig.clear()
+    # Make it current again so the plt.* calls below target it
+    plt.figure(fig.number)
+    return fig, fig.subplots(rows, 2, squeeze=False)
+
 
+def _draw_heatmap(ax, matrix: np.ndarray, cmap: str):
+    """Draw a 7 x weeks activity grid with one flat-shaded cell per day, laid out like imshow."""
+    rows, cols = matrix.shape
+    # Cell edges at +/-0.5 keep integer ticks centred on cells; rasterized so savefig
+    # writes one image rather than a vector rectangle per cell
+    mesh = ax.pcolormesh(np.arange(cols + 1) - 0.5, np.arange(rows + 1) - 0.5, matrix,
+                         cmap=cmap, shading='flat', rasterized=True)
+    ax.invert_yaxis()
+    return mesh
 
-def create_comprehensive_heatmap(data: Dict, output_path: str = None):
-    """Create a comprehensive heatmap visualization of all productivity metrics."""
+
+def _save_heatmap_png(matrix: np.ndarray, cmap: str, path: str, cell_size: int = 20):
+    """Write an activity grid straight to PNG via Pillow, without figure, axes or labels."""
+    import matplotlib
+    from PIL import Image
+    
+    peak = matrix.max()
+    rgba = matplotlib.colormaps[cmap](matrix / peak if peak else matrix, bytes=True)
+    rows, cols = matrix.shape
+    Image.fromarray(rgba).resize((cols * cell_size, rows * cell_size), Image.NEAREST).save(path)
+
+
+def _daily_vector(days: np.ndarray, totals: np.ndarray, start_date, n_days: int) -> np.ndarray:
+    """Per-day totals indexed by day offset from start_date; days outside the range are dropped."""
+    offsets = (days - np.datetime64(start_date, 'D')).astype(np.int64)
+    in_range = (offsets >= 0) & (offsets < n_days)
+    return np.bincount(offsets[in_range], weights=totals[in_range], minlength=n_days)
+
+
+def _grid_indices(start_date, n_days: int):
+    """Heatmap cell of each day offset from start_date: (weekday row, 7-day block column)."""
+    offsets = np.arange(n_days)
+    return (offsets + start_date.weekday()) % 7, offsets // 7
+
+
+def create_comprehensive_heatmap(data: Dict, output_path: str = None, high_quality: bool = False,
+                                 commit_arrays: Optional[tuple] = None):
+    """Create a comprehensive heatmap visualization of all productivity metrics.
+
+    commit_arrays is the (days, line changes) pair for data['repositories'], when the caller
+    has already extracted it.
+    """
     if not data:
         print("No data available for heatmap generation.")
         return
@@ -39,85 +139,70 @@ def create_comprehensive_heatmap(data: Dict, output_path: str = None):
     
     # Calculate figure size based on number of metrics
     rows = len(metrics) + 1  # +1 for summary
-    fig, axes = plt.subplots(rows, 2, figsize=(18, 4 * rows))
-    if rows == 1:
-        axes = [axes]
+    plt = _pyplot()
+    fig, axes = _dashboard_figure(plt, rows)
     
     # Get date range from timeframe
-    since_date = datetime.fromisoformat(data['timeframe']['since'].replace('Z', '+00:00')).date()
-    until_date = datetime.fromisoformat(data['timeframe']['until'].replace('Z', '+00:00')).date()
+    since_date = date.fromisoformat(data['timeframe']['since'][:10])
+    until_date = date.fromisoformat(data['timeframe']['until'][:10])
     
-    # Create date range
-    date_range = []
-    current_date = since_date
-    while current_date <= until_date:
-        date_range.append(current_date)
-        current_date += timedelta(days=1)
+    # Days in the range; the heatmaps only ever index it by offset from since_date
+    n_days = max(0, (until_date - since_date).days + 1)
     
-    weeks = len(date_range) // 7 + 1
+    weeks = n_days // 7 + 1
+    # Heatmap cell of every day, shared by all metrics and the summary row
+    dow_idx, week_idx = _grid_indices(since_date, n_days)
     colors = ['Greens', 'Blues', 'Oranges', 'Purples', 'Reds']
-    all_activities = {}
+    daily_vectors = []
+    commit_days, commit_lines = commit_arrays or _commit_arrays(data.get('repositories'))
     
     # Process each metric
     for idx, metric in enumerate(metrics):
-        daily_counts = defaultdict(int)
+        weights = None
         
-        if metric == 'commits' and data.get('repositories'):
-            for repo_data in data['repositories'].values():
-                for commit in repo_data['commits']:
-                    commit_date = datetime.fromisoformat(commit['commit']['author']['date'].replace('Z', '+00:00')).date()
-                    daily_counts[commit_date] += 1
+        if metric == 'commits':
+            metric_days = commit_days
         
-        elif metric == 'pull_requests' and data.get('pull_requests'):
-            for pr in data['pull_requests']['data']:
-                pr_date = datetime.fromisoformat(pr['created_at'].replace('Z', '+00:00')).date()
-                daily_counts[pr_date] += 1
+        elif metric == 'pull_requests':
+            metric_days = _parse_days([pr['created_at'] for pr in data['pull_requests']['data']])
         
-        elif metric == 'code_reviews' and data.get('code_reviews'):
-            for review in data['code_reviews']['data']:
-                review_date = datetime.fromisoformat(review['updated_at'].replace('Z', '+00:00')).date()
-                daily_counts[review_date] += 1
+        elif metric == 'code_reviews':
+            metric_days = _parse_days([review['updated_at'] for review in data['code_reviews']['data']])
         
-        elif metric == 'issues' and data.get('issues'):
-            for issue in data['issues']['data']:
-                issue_date = datetime.fromisoformat(issue['created_at'].replace('Z', '+00:00')).date()
-                daily_counts[issue_date] += 1
+        elif metric == 'issues':
+            metric_days = _parse_days([issue['created_at'] for issue in data['issues']['data']])
         
-        elif metric == 'lines_modified' and data.get('line_stats'):
-            # For lines modified, we need to aggregate from commits
-            for repo_data in data['repositories'].values():
-                for commit in repo_data['commits']:
-                    if commit.get('stats'):
-                        commit_date = datetime.fromisoformat(commit['commit']['author']['date'].replace('Z', '+00:00')).date()
-                        lines_changed = commit['stats'].get('total', 0)
-                        daily_counts[commit_date] += lines_changed
+        elif metric == 'lines_modified':
+            # For lines modified, we need to aggregate from commits that carry stats
+            with_stats = commit_lines >= 0
+            metric_days = commit_days[with_stats]
+            weights = commit_lines[with_stats]
         
-        all_activities[metric] = daily_counts
+        days, totals = _daily_totals(metric_days, weights)
         
         # Create activity matrix
+        daily_vector = _daily_vector(days, totals, since_date, n_days)
+        daily_vectors.append(daily_vector)
         activity_matrix = np.zeros((7, weeks))
-        for i, date in enumerate(date_range):
-            if i < 7 * weeks:
-                week = i // 7
-                day_of_week = date.weekday()
-                activity_matrix[day_of_week, week] = daily_counts.get(date, 0)
+        activity_matrix[dow_idx, week_idx] = daily_vector
         
         # Heatmap
         ax_heatmap = axes[idx][0]
-        im = ax_heatmap.imshow(activity_matrix, cmap=colors[idx % len(colors)], aspect='auto')
+        im = _draw_heatmap(ax_heatmap, activity_matrix, colors[idx % len(colors)])
         ax_heatmap.set_title(f"{metric.replace('_', ' ').title()} Activity", fontweight='bold')
         ax_heatmap.set_ylabel('Day of Week')
         ax_heatmap.set_yticks(range(7))
         ax_heatmap.set_yticklabels(['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'])
-        plt.colorbar(im, ax=ax_heatmap, label=f'{metric.replace("_", " ").title()} per Day')
+        # A colorbar for an all-zero heatmap carries no information but costs a layout pass
+        if activity_matrix.any():
+            plt.colorbar(im, ax=ax_heatmap, label=f'{metric.replace("_", " ").title()} per Day')
         
         # Timeline
         ax_timeline = axes[idx][1]
-        dates = sorted(daily_counts.keys())
-        counts = [daily_counts[date] for date in dates]
-        if dates and counts:
-            ax_timeline.plot(dates, counts, marker='o', linewidth=2, markersize=3)
-            ax_timeline.fill_between(dates, counts, alpha=0.3)
+        # Unique days already come back sorted, so they plot as-is
+        if len(days):
+            ax_timeline.plot(days, totals, marker='o', linewidth=2, markersize=3)
+            ax_timeline.fill_between(days, totals, alpha=0.3)
         ax_timeline.set_title(f"{metric.replace('_', ' ').title()} Timeline", fontweight='bold')
         
         # Set appropriate y-axis label based on metric
@@ -134,47 +219,33 @@ def create_comprehensive_heatmap(data: Dict, output_path: str = None):
     ax_summary_pie = axes[-1][1]
     
     # Combined heatmap (sum of all activities)
-    combined_daily = defaultdict(int)
-    for metric_counts in all_activities.values():
-        for date, count in metric_counts.items():
-            combined_daily[date] += count
-    
     combined_matrix = np.zeros((7, weeks))
-    for i, date in enumerate(date_range):
-        if i < 7 * weeks:
-            week = i // 7
-            day_of_week = date.weekday()
-            combined_matrix[day_of_week, week] = combined_daily.get(date, 0)
+    combined_matrix[dow_idx, week_idx] = np.sum(daily_vectors, axis=0)
     
-    im_combined = ax_summary_heat.imshow(combined_matrix, cmap='Reds', aspect='auto')
+    im_combined = _draw_heatmap(ax_summary_heat, combined_matrix, 'Reds')
     ax_summary_heat.set_title('Combined Activity Heatmap', fontweight='bold', fontsize=14)
     ax_summary_heat.set_ylabel('Day of Week')
     ax_summary_heat.set_xlabel('Week')
     ax_summary_heat.set_yticks(range(7))
     ax_summary_heat.set_yticklabels(['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'])
-    plt.colorbar(im_combined, ax=ax_summary_heat, label='Total Activity per Day')
+    if combined_matrix.any():
+        plt.colorbar(im_combined, ax=ax_summary_heat, label='Total Activity per Day')
     
     # Metrics distribution pie chart
+    totals_by_metric = {
+        'commits': data.get('total_commits', 0),
+        'pull_requests': (data.get('pull_requests') or {}).get('total', 0),
+        'code_reviews': (data.get('code_reviews') or {}).get('total', 0),
+        'issues': (data.get('issues') or {}).get('total', 0),
+        'lines_modified': (data.get('line_stats') or {}).get('total_changes', 0),
+    }
     metric_totals = []
     metric_labels = []
     for metric in metrics:
-        if metric == 'commits':
-            total = data['total_commits']
-        elif metric == 'pull_requests':
-            total = data['pull_requests']['total']
-        elif metric == 'code_reviews':
-            total = data['code_reviews']['total']
-        elif metric == 'issues':
-            total = data['issues']['total']
-        elif metric == 'lines_modified':
-            total = data['line_stats']['total_changes']
-        
+        total = totals_by_metric[metric]
         if total > 0:
             metric_totals.append(total)
-            if metric == 'lines_modified':
-                metric_labels.append(f"Lines Modified ({total})")
-            else:
-                metric_labels.append(f"{metric.replace('_', ' ').title()} ({total})")
+            metric_labels.append(f"{metric.replace('_', ' ').title()} ({total})")
     
     if metric_totals:
         ax_summary_pie.pie(metric_totals, labels=metric_labels, autopct='%1.1f%%', startangle=90)
@@ -186,10 +257,7 @@ def create_comprehensive_heatmap(data: Dict, output_path: str = None):
     until_formatted = until_date.strftime('%B %d, %Y')
     
     fig.suptitle(f"Comprehensive Productivity Dashboard: {data['username']}\\n{since_formatted} to {until_formatted}", 
-                fontsize=16, fontweight='bold', y=0.98)
-    
-    plt.tight_layout()
-    plt.subplots_adjust(top=0.95)
+                fontsize=16, fontweight='bold')
     
     # Create output directory and save files
     output_dir = create_output_directory(data['username'])
@@ -200,7 +268,7 @@ def create_comprehensive_heatmap(data: Dict, output_path: str = None):
     else:
         final_path = os.path.join(output_dir, f"comprehensive_dashboard_{data['username']}_{timestamp}.png")
     
-    plt.savefig(final_path, dpi=300, bbox_inches='tight')
+    plt.savefig(final_path, dpi=_HIGH_QUALITY_DPI if high_quality else _PREVIEW_DPI)
     print(f"Comprehensive heatmap saved to {final_path}")
     
     try:
@@ -209,51 +277,57 @@ def create_comprehensive_heatmap(data: Dict, output_path: str = None):
         print("Plot saved to file (display not available)")
 
 
-def create_simple_heatmap(data: Dict, output_path: str = None):
-    """Create a simple heatmap visualization for commits only."""
+def create_simple_heatmap(data: Dict, output_path: str = None, high_quality: bool = False, fast: bool = False,
+                          commit_days: Optional[np.ndarray] = None):
+    """Create a simple heatmap visualization for commits only.
+
+    With fast=True a PNG target gets just the bare activity grid, rendered with Pillow.
+    commit_days is the commit day array for data['repositories'], if already extracted.
+    """
     if not data or not data.get('repositories'):
         print("No data available for heatmap generation.")
         return
     
-    # Collect all commits with dates
-    all_commits = []
-    for repo_data in data['repositories'].values():
-        for commit in repo_data['commits']:
-            commit_date = datetime.fromisoformat(commit['commit']['author']['date'].replace('Z', '+00:00'))
-            all_commits.append(commit_date.date())
+    # Collect all commit dates and count commits per day
+    if commit_days is None:
+        commit_days = _commit_days(data['repositories'])
+    days, commit_counts = _daily_totals(commit_days)
     
-    if not all_commits:
+    if not len(days):
         print("No commits found for heatmap generation.")
         return
     
-    # Count commits per day
-    commit_counts = Counter(all_commits)
-    
-    # Get date range
-    start_date = min(all_commits)
-    end_date = max(all_commits)
-    
-    # Create date range and commit counts array
-    date_range = []
-    current_date = start_date
-    while current_date <= end_date:
-        date_range.append(current_date)
-        current_date += timedelta(days=1)
+    # Get date range (unique days come back sorted)
+    start_date = days[0].item()
+    n_days = int((days[-1] - days[0]).astype(np.int64)) + 1
     
     # Create activity matrix (7 rows for days of week, columns for weeks)
-    weeks = len(date_range) // 7 + 1
+    weeks = n_days // 7 + 1
+    dow_idx, week_idx = _grid_indices(start_date, n_days)
     activity_matrix = np.zeros((7, weeks))
+    activity_matrix[dow_idx, week_idx] = _daily_vector(days, commit_counts, start_date, n_days)
+    
+    # Create output directory and resolve the output file
+    output_dir = create_output_directory(data['username'])
+    timestamp = datetime.now().strftime('%Y-%m-%d')
     
-    for i, date in enumerate(date_range):
-        week = i // 7
-        day_of_week = date.weekday()
-        activity_matrix[day_of_week, week] = commit_counts.get(date, 0)
+    if output_path:
+        final_path = output_path
+    else:
+        final_path = os.path.join(output_dir, f"productivity_heatmap_{data['username']}_{timestamp}.png")
+    
+    # Fast path: no labels or pie chart, so skip matplotlib's figure machinery entirely
+    if fast and final_path.lower().endswith('.png'):
+        _save_heatmap_png(activity_matrix, 'Greens', final_path)
+        print(f"Heatmap saved to {final_path}")
+        return
     
     # Create the heatmap
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(15, 10))
+    plt = _pyplot()
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(15, 10), constrained_layout=True)
     
     # Daily activity heatmap (GitHub-style)
-    im1 = ax1.imshow(activity_matrix, cmap='Greens', aspect='auto')
+    im1 = _draw_heatmap(ax1, activity_matrix, 'Greens')
     ax1.set_title(f"Commit Activity Heatmap for {data['username']}", 
                  fontsize=14, fontweight='bold')
     ax1.set_ylabel('Day of Week')
@@ -271,9 +345,9 @@ def create_simple_heatmap(data: Dict, output_path: str = None):
     
     # Only show top 10 repos, group others as 'Others'
     if len(repo_names) > 10:
-        sorted_repos = sorted(zip(repo_names, commit_counts_by_repo), key=lambda x: x[1], reverse=True)
-        top_repos = sorted_repos[:10]
-        others_count = sum([count for _, count in sorted_repos[10:]])
+        # Partial sort: only the top 10 need ordering (ties keep repository order, as sorted() did)
+        top_repos = heapq.nlargest(10, zip(repo_names, commit_counts_by_repo), key=lambda x: x[1])
+        others_count = sum(commit_counts_by_repo) - sum(count for _, count in top_repos)
         
         repo_names = [name for name, _ in top_repos] + ['Others']
         commit_counts_by_repo = [count for _, count in top_repos] + [others_count]
@@ -282,18 +356,7 @@ def create_simple_heatmap(data: Dict, output_path: str = None):
     ax2.set_title(f"Commit Distribution by Repository\\nTotal: {data['total_commits']} commits", 
                  fontsize=12, fontweight='bold')
     
-    plt.tight_layout()
-    
-    # Create output directory and save files
-    output_dir = create_output_directory(data['username'])
-    timestamp = datetime.now().strftime('%Y-%m-%d')
-    
-    if output_path:
-        final_path = output_path
-    else:
-        final_path = os.path.join(output_dir, f"productivity_heatmap_{data['username']}_{timestamp}.png")
-    
-    plt.savefig(final_path, dpi=300, bbox_inches='tight')
+    plt.savefig(final_path, dpi=_HIGH_QUALITY_DPI if high_quality else _PREVIEW_DPI)
     print(f"Heatmap saved to {final_path}")
     
     try:
@@ -302,7 +365,7 @@ def create_simple_heatmap(data: Dict, output_path: str = None):
         print("Plot saved to file (display not available)")
 
 
-def create_heatmap(data: Dict, output_path: str = None):
+def create_heatmap(data: Dict, output_path: str = None, high_quality: bool = False, fast: bool = False):
     """Create a heatmap visualization - delegates to comprehensive version if multiple metrics available."""
     # Handle comparison data structure
     if 'comparison' in data:
@@ -312,21 +375,25 @@ def create_heatmap(data: Dict, output_path: str = None):
         viz_data = data
     
     # Check if we have additional metrics beyond commits
-    has_additional_metrics = any([
-        viz_data.get('pull_requests', {}).get('total', 0) > 0,
-        viz_data.get('code_reviews', {}).get('total', 0) > 0,
-        viz_data.get('issues', {}).get('total', 0) > 0,
-        viz_data.get('line_stats', {}).get('total_changes', 0) > 0
-    ])
-    
+    # Short-circuits on the first metric with activity
+    has_additional_metrics = (
+        (viz_data.get('pull_requests') or {}).get('total', 0) > 0
+        or (viz_data.get('code_reviews') or {}).get('total', 0) > 0
+        or (viz_data.get('issues') or {}).get('total', 0) > 0
+        or (viz_data.get('line_stats') or {}).get('total_changes', 0) > 0
+    )
+    
+    # Commit arrays are extracted once here and handed to whichever heatmap is drawn
     if has_additional_metrics:
         print("Multiple metrics detected - creating comprehensive dashboard...")
-        create_comprehensive_heatmap(viz_data, output_path)
+        create_comprehensive_heatmap(viz_data, output_path, high_quality,
+                                     _commit_arrays(viz_data.get('repositories')))
     else:
-        create_simple_heatmap(viz_data, output_path)
+        create_simple_heatmap(viz_data, output_path, high_quality, fast,
+                              _commit_days(viz_data.get('repositories')))
 
 
-def create_timeline_chart(data: Dict, output_path: str = None):
+def create_timeline_chart(data: Dict, output_path: str = None, high_quality: bool = False):
     """Create a timeline chart showing daily commit activity."""
     # Handle both regular data and comparison data structures
     repositories_data = None
@@ -337,60 +404,36 @@ def create_timeline_chart(data: Dict, output_path: str = None):
         repositories_data = data['repositories']
         chart_title = f"Daily Commit Activity - {data.get('username', 'User')}"
     elif 'organization' in data and 'personal' in data:
-        # Comparison data - combine both org and personal commits
-        daily_commits = defaultdict(int)
-        
-        # Add organization commits
-        if data['organization'] and data['organization'].get('data', {}).get('repositories'):
-            for repo_data in data['organization']['data']['repositories'].values():
-                for commit in repo_data.get('commits', []):
-                    commit_date = datetime.fromisoformat(commit['commit']['author']['date'].replace('Z', '+00:00'))
-                    date_key = commit_date.date()
-                    daily_commits[date_key] += 1
-        
-        # Add personal commits
-        if data['personal'] and data['personal'].get('data', {}).get('repositories'):
-            for repo_data in data['personal']['data']['repositories'].values():
-                for commit in repo_data.get('commits', []):
-                    commit_date = datetime.fromisoformat(commit['commit']['author']['date'].replace('Z', '+00:00'))
-                    date_key = commit_date.date()
-                    daily_commits[date_key] += 1
+        # Comparison data - combine both org and personal commits, keeping the per-side breakdown
+        org_repos = data['organization'] and data['organization'].get('data', {}).get('repositories')
+        personal_repos = data['personal'] and data['personal'].get('data', {}).get('repositories')
+        org_days = _commit_days(org_repos)
+        personal_days = _commit_days(personal_repos)
         
         # Create timeline with combined data
-        if not daily_commits:
+        if not len(org_days) and not len(personal_days):
             print("No commits found for timeline chart generation.")
             return
         
-        dates = sorted(daily_commits.keys())
-        counts = [daily_commits[date] for date in dates]
+        days, counts = np.unique(np.concatenate((org_days, personal_days)), return_counts=True)
+        
+        # Per-side counts aligned to the combined (sorted) days
+        org_counts = np.zeros(len(days), dtype=np.int64)
+        personal_counts = np.zeros(len(days), dtype=np.int64)
+        for side_days, side_counts in ((org_days, org_counts), (personal_days, personal_counts)):
+            unique_days, unique_counts = np.unique(side_days, return_counts=True)
+            side_counts[np.searchsorted(days, unique_days)] = unique_counts
+        
+        dates = days.astype(object)
         chart_title = f"Combined Daily Activity - {data.get('username', 'User')}"
         
         # Create the chart directly here for comparison data
-        fig, ax = plt.subplots(figsize=(15, 6))
+        plt = _pyplot()
+        import matplotlib.dates as mdates
+        fig, ax = plt.subplots(figsize=(15, 6), constrained_layout=True)
         ax.plot(dates, counts, marker='o', linewidth=2, markersize=4, label='Total Commits')
         
-        # Add separate lines for org vs personal if we want to show breakdown
-        org_daily = defaultdict(int)
-        personal_daily = defaultdict(int)
-        
-        if data['organization'] and data['organization'].get('data', {}).get('repositories'):
-            for repo_data in data['organization']['data']['repositories'].values():
-                for commit in repo_data.get('commits', []):
-                    commit_date = datetime.fromisoformat(commit['commit']['author']['date'].replace('Z', '+00:00'))
-                    date_key = commit_date.date()
-                    org_daily[date_key] += 1
-        
-        if data['personal'] and data['personal'].get('data', {}).get('repositories'):
-            for repo_data in data['personal']['data']['repositories'].values():
-                for commit in repo_data.get('commits', []):
-                    commit_date = datetime.fromisoformat(commit['commit']['author']['date'].replace('Z', '+00:00'))
-                    date_key = commit_date.date()
-                    personal_daily[date_key] += 1
-        
         # Plot separate lines for org and personal
-        org_counts = [org_daily.get(date, 0) for date in dates]
-        personal_counts = [personal_daily.get(date, 0) for date in dates]
-        
         ax.plot(dates, org_counts, marker='s', linewidth=1, markersize=3, alpha=0.7, label='Organization')
         ax.plot(dates, personal_counts, marker='^', linewidth=1, markersize=3, alpha=0.7, label='Personal')
         
@@ -405,10 +448,8 @@ def create_timeline_chart(data: Dict, output_path: str = None):
         ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(dates)//10)))
         plt.xticks(rotation=45)
         
-        plt.tight_layout()
-        
         if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
+            plt.savefig(output_path, dpi=_HIGH_QUALITY_DPI if high_quality else _PREVIEW_DPI)
             print(f"Timeline chart saved to {output_path}")
         
         try:
@@ -425,24 +466,20 @@ def create_timeline_chart(data: Dict, output_path: str = None):
         print("No repository data available for timeline chart generation.")
         return
     
-    # Collect all commits with dates (for regular data)
-    daily_commits = defaultdict(int)
-    for repo_data in repositories_data.values():
-        for commit in repo_data.get('commits', []):
-            commit_date = datetime.fromisoformat(commit['commit']['author']['date'].replace('Z', '+00:00'))
-            date_key = commit_date.date()
-            daily_commits[date_key] += 1
+    # Collect all commit days and count commits per day (for regular data)
+    days, counts = np.unique(_commit_days(repositories_data), return_counts=True)
     
-    if not daily_commits:
+    if not len(days):
         print("No commits found for timeline chart generation.")
         return
     
-    # Sort dates and prepare data
-    dates = sorted(daily_commits.keys())
-    counts = [daily_commits[date] for date in dates]
+    # Sorted by np.unique; plot with Python dates
+    dates = days.astype(object)
     
     # Create timeline chart
-    fig, ax = plt.subplots(figsize=(15, 6))
+    plt = _pyplot()
+    import matplotlib.dates as mdates
+    fig, ax = plt.subplots(figsize=(15, 6), constrained_layout=True)
     ax.plot(dates, counts, marker='o', linewidth=2, markersize=4)
     ax.fill_between(dates, counts, alpha=0.3)
     
@@ -453,12 +490,12 @@ def create_timeline_chart(data: Dict, output_path: str = None):
     ax.grid(True, alpha=0.3)
     
     # Format x-axis dates
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-    ax.xaxis.set_major_locator(mdates.WeekdayLocator(interval=1))
+    # AutoDateLocator caps the tick count, so long ranges don't produce a tick per week
+    locator = mdates.AutoDateLocator(maxticks=10)
+    ax.xaxis.set_major_locator(locator)
+    ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
     plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
     
-    plt.tight_layout()
-    
     # Create output directory and save files
     username = data.get('username', 'user')
     output_dir = create_output_directory(username)
@@ -469,7 +506,7 @@ def create_timeline_chart(data: Dict, output_path: str = None):
     else:
         final_path = os.path.join(output_dir, f"commit_timeline_{username}_{timestamp}.png")
     
-    plt.savefig(final_path, dpi=300, bbox_inches='tight')
+    plt.savefig(final_path, dpi=_HIGH_QUALITY_DPI if high_quality else _PREVIEW_DPI)
     print(f"Timeline chart saved to {final_path}")
     
     try: